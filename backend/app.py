@@ -1,4 +1,8 @@
-from flask import Flask
+import gzip
+import time
+import logging
+from functools import lru_cache
+from flask import Flask, Response, g, jsonify, request
 from routes.power import power
 from routes.temperature import temperature
 from routes.dashboard import dashboard
@@ -8,8 +12,23 @@ from routes.system_temperature import system_temperature
 from routes.power_capacity import power_capacity
 from flask_cors import CORS
 from routes.nmap_scan import nmap_scan
+from utils.metrics import HTTP_REQ_COUNTER, HTTP_REQ_LATENCY, render_metrics
+from utils.models.power import Power
+
+# Configure logging once for all blueprints
+logging.basicConfig(
+    level=logging.INFO,
+    format="[%(asctime)s] %(levelname)s %(name)s: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
 
 app = Flask(__name__)
+
+# Compound (site, created) index for the power range queries
+try:
+    Power().ensure_indexes()
+except Exception as e:
+    logging.getLogger(__name__).warning("Could not ensure power indexes: %s", e)
 CORS(
     app,
     origins="*",
@@ -24,6 +43,56 @@ app.register_blueprint(monthly_data, url_prefix="/api/monthly-power-data")
 app.register_blueprint(power_capacity, url_prefix="/api/power-capacity")
 app.register_blueprint(nmap_scan, url_prefix="/api/nmap-scan")
 
+
+# Request metrics – label children are cached so each request skips the
+# labels() hash + lock. Endpoint is the route name, never the raw path,
+# to keep label cardinality bounded.
+@lru_cache(maxsize=4096)
+def _request_counter(endpoint, method, status):
+    return HTTP_REQ_COUNTER.labels(endpoint=endpoint, method=method, status=status)
+
+
+@lru_cache(maxsize=1024)
+def _request_latency(endpoint):
+    return HTTP_REQ_LATENCY.labels(endpoint=endpoint)
+
+
+@app.before_request
+def start_request_timer():
+    g.request_start_ns = time.perf_counter_ns()
+
+
+@app.after_request
+def record_request(response):
+    endpoint = request.endpoint or "unmatched"
+    if HTTP_REQ_COUNTER:
+        _request_counter(endpoint, request.method, str(response.status_code)).inc()
+    if HTTP_REQ_LATENCY:
+        try:
+            elapsed_ns = time.perf_counter_ns() - g.request_start_ns
+        except AttributeError:
+            # before_request was skipped (e.g. an earlier hook returned early)
+            pass
+        else:
+            _request_latency(endpoint).observe(elapsed_ns / 1e9)
+    return response
+
+
+@app.route("/metrics")
+def metrics():
+    if HTTP_REQ_COUNTER is None:
+        return jsonify({"error": "prometheus_client is not installed"}), 503
+    data, content_type = render_metrics()
+    # Prometheus scrapers send Accept-Encoding: gzip; level 1 is plenty
+    # for the highly repetitive exposition text
+    if request.accept_encodings["gzip"]:
+        response = Response(gzip.compress(data, compresslevel=1), mimetype=content_type)
+        response.headers["Content-Encoding"] = "gzip"
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
+    return Response(data, mimetype=content_type)
+
+
 # OpenAPI Specification
 @app.route('/openapi.json')
 def openapi_spec():
@@ -325,6 +394,30 @@ def openapi_spec():
                     "responses": {"200": {"description": "Ignore status"}}
                 }
             },
+            "/api/nmap-scan/scan": {
+                "post": {
+                    "summary": "Start Network Scan",
+                    "description": "Queue an nmap scan in the background and return its task id",
+                    "tags": ["Network Scanning"],
+                    "responses": {
+                        "202": {
+                            "description": "Scan queued",
+                            "content": {"application/json": {"example": {"status": "pending", "task_id": "3f2a..."}}}
+                        }
+                    }
+                }
+            },
+            "/api/nmap-scan/scan/result/{task_id}": {
+                "get": {
+                    "summary": "Get Scan Result",
+                    "description": "Poll a queued scan; returns status running until the scan and DB comparison finish",
+                    "tags": ["Network Scanning"],
+                    "parameters": [
+                        {"name": "task_id", "in": "path", "required": True, "schema": {"type": "string"}, "description": "Task id returned by POST /scan"}
+                    ],
+                    "responses": {"200": {"description": "Scan result or running status"}, "404": {"description": "Unknown task id"}}
+                }
+            },
             "/api/nmap-scan/ignored-devices": {
                 "get": {
                     "summary": "Get Ignored Devices",
@@ -363,5 +456,24 @@ def swagger_ui():
 </html>'''
     return html
 
+
+# Status codes the API actually returns; anything else is created lazily
+WARM_STATUS_CODES = ("200", "202", "400", "401", "404", "500")
+
+
+def warm_request_metrics():
+    """Create label children for every route up front so the first hit
+    on each endpoint doesn't take the prometheus_client registry lock."""
+    if HTTP_REQ_COUNTER is None:
+        return
+    for rule in app.url_map.iter_rules():
+        _request_latency(rule.endpoint)
+        for method in rule.methods - {"HEAD", "OPTIONS"}:
+            for status in WARM_STATUS_CODES:
+                _request_counter(rule.endpoint, method, status)
+
+
+warm_request_metrics()
+
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=5000)
\ No newline at end of file
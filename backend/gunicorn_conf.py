@@ -0,0 +1,40 @@
+# backend/gunicorn_conf.py
+"""
+Gunicorn settings for the backend API.
+Usage: gunicorn -c gunicorn_conf.py app:app
+"""
+import os
+
+bind = f"0.0.0.0:{os.environ.get('BACKEND_PORT', '5000')}"
+
+# Threaded workers keep a long-running /api/nmap-scan/scan from
+# blocking the dashboard endpoints
+worker_class = "gthread"
+workers = int(os.environ.get("GUNICORN_WORKERS", 4))
+threads = int(os.environ.get("GUNICORN_THREADS", 8))
+
+# nmap scans may take up to 300s; leave headroom before the worker is killed
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 360))
+graceful_timeout = 30
+keepalive = 5
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.environ.get("GUNICORN_LOG_LEVEL", "info")
+
+
+def on_starting(server):
+    # Start each run with an empty multiprocess metrics dir so counters
+    # from a previous container lifetime are not re-aggregated
+    metrics_dir = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if metrics_dir:
+        os.makedirs(metrics_dir, exist_ok=True)
+        for name in os.listdir(metrics_dir):
+            if name.endswith(".db"):
+                os.remove(os.path.join(metrics_dir, name))
+
+
+def child_exit(server, worker):
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
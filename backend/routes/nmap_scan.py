@@ -1,11 +1,23 @@
 # backend/routes/nmap_scan.py
-import re
+import json
+import uuid
+import socket
+import asyncio
+import logging
+import ipaddress
 import subprocess
 import platform
 import os
+import tempfile
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from datetime import datetime, timedelta
 from functools import wraps
+from xml.etree import ElementTree
 
 from flask import Blueprint, jsonify, request
 from utils.models.systems import Systems
@@ -14,9 +26,20 @@ from utils.models.change_log import ChangeLog
 from utils.models.ignored_device import IgnoredDevice
 from utils.models.disabled_device import DisabledDevice
 from utils.factory.database import Database
+from utils.factory.redis_client import redis
+
+try:
+    from icmplib import async_multiping
+    from icmplib.exceptions import ICMPLibError
+except ImportError:
+    # icmplib is optional; scans fall back to nmap without it
+    async_multiping = None
+    ICMPLibError = None
 
 nmap_scan = Blueprint("nmap_scan", __name__)
 
+log = logging.getLogger(__name__)
+
 
 def serialize(doc):
     """Recursively convert ObjectId and datetime to JSON-safe types."""
@@ -35,6 +58,35 @@ def serialize(doc):
 # Admin password - should be stored in environment variable in production
 ADMIN_PASSWORD = os.environ.get("NMAP_ADMIN_PASSWORD", "admin123")
 
+NMAP_TIMEOUT_SECONDS = 300
+
+# Ping sweep tuned for the lab /24s: probe whole subnets per host group.
+# run_local_nmap adds -n and names the live hosts afterwards in one pooled
+# resolve_up_hosts pass, the same as the ICMP path.
+NMAP_SWEEP_ARGS = ["-sn", "-T4", "--min-hostgroup", "256", "--min-parallelism", "64"]
+
+# "nmap" (default) = nmap ping sweep; "icmp" = opt-in in-process echo sweep
+# (needs icmplib + NET_RAW). ICMP alone misses hosts that drop echo requests,
+# which nmap's -sn still finds through its TCP/ARP probes.
+SCAN_METHOD = os.environ.get("SCAN_METHOD", "nmap").lower()
+ICMP_TIMEOUT_SECONDS = 1
+# Echoes per address, so one lost packet does not mark a host as down
+ICMP_PING_COUNT = 2
+ICMP_PING_INTERVAL_SECONDS = 0.2
+ICMP_CONCURRENT_TASKS = 512
+RDNS_MAX_WORKERS = 64
+
+# Tracked systems/PDUs are cached between scans; write endpoints invalidate.
+# The cache is per gunicorn worker, so invalidation bumps a generation counter
+# in Redis that every worker checks before reusing its copy.
+LOOKUP_CACHE_TTL_SECONDS = 60
+LOOKUP_GENERATION_KEY = "nmap_scan:lookup_generation"
+_lookup_cache = {"loaded_at": 0.0, "generation": None, "data": None}
+
+# Only the fields compare_with_database reads (_id is always returned)
+SYSTEM_LOOKUP_PROJECTION = {"system": 1, "bmc_ip": 1, "last_seen": 1}
+PDU_LOOKUP_PROJECTION = {"hostname": 1, "ip": 1, "last_seen": 1}
+
 
 def detect_pdu_type(hostname, ip, v2c="amd123"):
     """Detect PDU type via SNMP sysDescr query and return type + default OID."""
@@ -48,11 +100,12 @@ def detect_pdu_type(hostname, ip, v2c="amd123"):
         )
         
         if result.returncode != 0:
-            print(f"SNMP query failed for {hostname} ({ip}): {result.stderr}")
+            log.warning("SNMP query failed for %s (%s): %s", hostname, ip, result.stderr)
             return {"type": "unknown", "default_oid": ""}
         
         sys_descr = result.stdout.strip().lower()
-        print(f"PDU {hostname} sysDescr: {sys_descr}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("PDU %s sysDescr: %s", hostname, sys_descr)
         
         # Match manufacturer in sysDescr
         if "tripp" in sys_descr or "tripplite" in sys_descr:
@@ -73,7 +126,7 @@ def detect_pdu_type(hostname, ip, v2c="amd123"):
             }
     
     except Exception as e:
-        print(f"Error detecting PDU type for {hostname}: {e}")
+        log.error("Error detecting PDU type for %s: %s", hostname, e)
         return {"type": "unknown", "default_oid": ""}
 
 
@@ -105,24 +158,34 @@ def validate_password():
 # Scanner service helpers (Windows Docker support)
 # -------------------------------------------------------------------
 
+# Read once at import; the env doesn't change for the life of a worker
+SCANNER_SERVICE_URL = os.environ.get("SCANNER_SERVICE_URL")
+
+# Keep-alive connections to the Windows scanner service across scans
+_scanner_session = requests.Session()
+_scanner_session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_scanner_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+
 def is_windows_with_scanner_service():
-    return os.environ.get("SCANNER_SERVICE_URL") is not None
+    return SCANNER_SERVICE_URL is not None
 
 
 def get_scanner_service_url():
-    return os.environ.get(
-        "SCANNER_SERVICE_URL",
-        "http://host.docker.internal:5001"
-    )
+    return SCANNER_SERVICE_URL or "http://host.docker.internal:5001"
 
 
 # -------------------------------------------------------------------
 # Nmap parsing
 # -------------------------------------------------------------------
 
-def parse_nmap_output(output: str):
+def parse_nmap_xml(source):
     """
-    Parse `nmap -sn` output and categorize devices.
+    Parse `nmap -sn -oX -` output and categorize devices.
+
+    `source` is a binary file object (e.g. a Popen stdout pipe); hosts are
+    handled as soon as their closing </host> tag arrives and then cleared,
+    so the full document is never held in memory.
     """
     devices = {
         "systems": [],
@@ -131,41 +194,160 @@ def parse_nmap_output(output: str):
         "no_hostname": []
     }
 
-    current_ip = None
-    current_hostname = None
-    host_is_up = False
-
-    for line in output.splitlines():
-        # Hostname + IP
-        m = re.search(
-            r"Nmap scan report for ([^\s]+) \((\d+\.\d+\.\d+\.\d+)\)",
-            line
-        )
-        if m:
-            _finalize_device(devices, current_ip, current_hostname, host_is_up)
-            current_hostname, current_ip = m.group(1), m.group(2)
-            host_is_up = False
+    for _, elem in ElementTree.iterparse(source, events=("end",)):
+        if elem.tag != "host":
             continue
 
-        # IP only
-        m = re.search(
-            r"Nmap scan report for (\d+\.\d+\.\d+\.\d+)",
-            line
+        status = elem.find("status")
+        if status is not None and status.get("state") == "up":
+            address = elem.find("address[@addrtype='ipv4']")
+            hostname = elem.find("hostnames/hostname")
+            _finalize_device(
+                devices,
+                address.get("addr") if address is not None else None,
+                hostname.get("name") if hostname is not None else None,
+                True
+            )
+        elem.clear()
+
+    return devices
+
+
+def run_local_nmap(networks, timeout=NMAP_TIMEOUT_SECONDS):
+    """
+    Run an nmap ping sweep and parse its XML while the scan is still running.
+    Returns (scanned_devices, returncode, stderr).
+    """
+    # -n: names are resolved afterwards by resolve_up_hosts, same as the ICMP path
+    cmd = ["nmap"] + NMAP_SWEEP_ARGS + ["-n", "-oX", "-"] + networks
+    # stderr goes to a temp file: a pipe read only after stdout's EOF would
+    # let a burst of nmap warnings fill it and stall the XML stream
+    with tempfile.TemporaryFile() as stderr_file:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file
         )
-        if m:
-            _finalize_device(devices, current_ip, current_hostname, host_is_up)
-            current_ip = m.group(1)
-            current_hostname = None
-            host_is_up = False
-            continue
 
-        if "Host is up" in line:
-            host_is_up = True
+        # Enforce the overall timeout while stdout is still being consumed
+        watchdog = threading.Timer(timeout, proc.kill)
+        watchdog.start()
+        parse_error = None
+        try:
+            try:
+                scanned_devices = parse_nmap_xml(proc.stdout)
+            except ElementTree.ParseError as e:
+                # Empty or truncated document: nmap failed or was killed
+                parse_error = e
+                scanned_devices = None
+                proc.stdout.read()
+            returncode = proc.wait(timeout=timeout)
+        finally:
+            watchdog.cancel()
+            proc.stdout.close()
+
+        stderr_file.seek(0)
+        stderr = stderr_file.read().decode("utf-8", errors="replace")
+
+    if parse_error is not None and returncode == 0:
+        returncode = -1
+        stderr = f"Invalid nmap XML output: {parse_error}"
+
+    return scanned_devices, returncode, stderr
+
+
+def _reverse_lookup(ip):
+    try:
+        return socket.gethostbyaddr(ip)[0]
+    except (socket.herror, socket.gaierror, OSError):
+        return None
+
+
+def resolve_up_hosts(up_ips):
+    """
+    Reverse-resolve live hosts on a thread pool and categorize them.
+    Lookups are not cached between scans: spotting renamed BMCs/PDUs is
+    the point of a scan.
+    """
+    devices = {
+        "systems": [],
+        "pdus": [],
+        "non_standard": [],
+        "no_hostname": []
+    }
+    if not up_ips:
+        return devices
 
-    _finalize_device(devices, current_ip, current_hostname, host_is_up)
+    with ThreadPoolExecutor(max_workers=min(RDNS_MAX_WORKERS, len(up_ips))) as executor:
+        hostnames = list(executor.map(_reverse_lookup, up_ips))
+
+    for ip, hostname in zip(up_ips, hostnames):
+        _finalize_device(devices, ip, hostname, True)
     return devices
 
 
+def icmp_sweep_networks(networks):
+    """
+    Ping every host address in `networks` from this process and resolve
+    names for the ones that answer. Raises ICMPLibError (e.g. missing
+    raw-socket permission) so the caller can fall back to nmap.
+    """
+    addresses = [
+        str(ip)
+        for network in networks
+        for ip in ipaddress.ip_network(network, strict=False).hosts()
+    ]
+    hosts = asyncio.run(async_multiping(
+        addresses,
+        count=ICMP_PING_COUNT,
+        interval=ICMP_PING_INTERVAL_SECONDS,
+        timeout=ICMP_TIMEOUT_SECONDS,
+        concurrent_tasks=ICMP_CONCURRENT_TASKS
+    ))
+    return resolve_up_hosts([h.address for h in hosts if h.is_alive])
+
+
+def scan_networks_local(networks):
+    """Scan from this host with nmap, or an ICMP sweep if SCAN_METHOD=icmp."""
+    if SCAN_METHOD == "icmp" and async_multiping is not None:
+        try:
+            return icmp_sweep_networks(networks), []
+        except ICMPLibError as e:
+            log.warning("ICMP sweep unavailable (%s), falling back to nmap", e)
+
+    return scan_networks_parallel(networks)
+
+
+def scan_networks_parallel(networks, timeout=NMAP_TIMEOUT_SECONDS):
+    """
+    Run one nmap process per network concurrently, then resolve names for
+    every live host in one pooled pass. Each process has its own watchdog,
+    so total wall clock stays bounded by `timeout`.
+    Returns (scanned_devices, errors).
+    """
+    up_ips = []
+    errors = []
+
+    if not networks:
+        return resolve_up_hosts(up_ips), errors
+
+    with ThreadPoolExecutor(max_workers=len(networks)) as executor:
+        results = list(executor.map(
+            lambda network: run_local_nmap([network], timeout),
+            networks
+        ))
+
+    for network, (devices, returncode, stderr) in zip(networks, results):
+        if returncode != 0:
+            errors.append(f"{network}: {stderr.strip() or f'nmap exited with {returncode}'}")
+            continue
+        # nmap runs with -n, so every live host lands in no_hostname
+        for entries in devices.values():
+            up_ips.extend(d["ip"] for d in entries)
+
+    return resolve_up_hosts(up_ips), errors
+
+
 def _finalize_device(devices, ip, hostname, host_is_up):
     if not ip or not host_is_up:
         return
@@ -180,12 +362,14 @@ def _finalize_device(devices, ip, hostname, host_is_up):
 
 
 def categorize_device(devices, ip, hostname):
+    # Lowercased once here so filtering/comparison never re-lowers it
     hostname_l = hostname.lower()
-    entry = {"ip": ip, "hostname": hostname}
+    entry = {"ip": ip, "hostname": hostname, "hostname_lc": hostname_l}
 
-    if "bmc" in hostname_l:
+    # Lab naming is "bmc-<system>.amd.com" / "pdu-<site>-<loc>.amd.com"
+    if hostname_l.startswith("bmc-"):
         devices["systems"].append(entry)
-    elif "pdu" in hostname_l:
+    elif hostname_l.startswith("pdu-"):
         devices["pdus"].append(entry)
     else:
         devices["non_standard"].append(entry)
@@ -202,10 +386,18 @@ def get_ignored_hostnames():
         ignored_devices = ignored_model.find({})
         return set(d.get("hostname", "").lower() for d in ignored_devices if d.get("hostname"))
     except Exception as e:
-        print(f"Error fetching ignored devices: {e}")
+        log.error("Error fetching ignored devices: %s", e)
         return set()
 
 
+def device_hostname_lc(device):
+    """
+    Lowercased hostname of a scanned device. Older Windows scanner builds do
+    not send hostname_lc, so fall back to lowering hostname.
+    """
+    return device.get("hostname_lc") or (device.get("hostname") or "").lower()
+
+
 def filter_ignored_devices(scanned_devices):
     """Remove ignored devices from scan results"""
     ignored_hostnames = get_ignored_hostnames()
@@ -217,7 +409,7 @@ def filter_ignored_devices(scanned_devices):
     for category, devices in scanned_devices.items():
         filtered[category] = [
             d for d in devices 
-            if not d.get("hostname") or d.get("hostname", "").lower() not in ignored_hostnames
+            if not d.get("hostname") or device_hostname_lc(d) not in ignored_hostnames
         ]
     
     return filtered
@@ -227,26 +419,71 @@ def filter_ignored_devices(scanned_devices):
 # Database comparison
 # -------------------------------------------------------------------
 
-def compare_with_database(scanned_devices):
-    systems_model = Systems()
-    pdu_model = PDU()
+def _lookup_generation():
+    """Current lookup generation from Redis, or None if Redis is unreachable."""
+    try:
+        return int(redis.get(LOOKUP_GENERATION_KEY) or 0)
+    except Exception as e:
+        log.warning("Could not read lookup generation from Redis: %s", e)
+        return None
 
-    tracked_systems = systems_model.find({})
-    tracked_pdus = pdu_model.find({})
 
-    # Build lookups
-    systems_by_name = {
-        s.get("system", "").lower(): s
-        for s in tracked_systems
-        if s.get("system")
-    }
-    systems_by_ip = {
-        s.get("bmc_ip"): s
-        for s in tracked_systems
-        if s.get("bmc_ip")
-    }
-    pdus_by_name = {p.get("hostname", "").lower(): p for p in tracked_pdus}
-    pdus_by_ip = {p.get("ip"): p for p in tracked_pdus if p.get("ip")}
+def get_tracked_lookups():
+    """
+    Return tracked systems/PDUs and their lookup dicts, reusing the last
+    DB fetch for up to LOOKUP_CACHE_TTL_SECONDS unless another worker has
+    invalidated them since. Without Redis the cache is bypassed.
+    """
+    now = time.monotonic()
+    generation = _lookup_generation()
+    if (_lookup_cache["data"] is None
+            or generation is None
+            or generation != _lookup_cache["generation"]
+            or now - _lookup_cache["loaded_at"] > LOOKUP_CACHE_TTL_SECONDS):
+        tracked_systems = Systems().find({}, projection=SYSTEM_LOOKUP_PROJECTION)
+        tracked_pdus = PDU().find({}, projection=PDU_LOOKUP_PROJECTION)
+
+        # Build lookups in one pass per collection
+        systems_by_name, systems_by_ip = {}, {}
+        for s in tracked_systems:
+            system_name = s.get("system")
+            if system_name:
+                systems_by_name[system_name.lower()] = s
+            bmc_ip = s.get("bmc_ip")
+            if bmc_ip:
+                systems_by_ip[bmc_ip] = s
+
+        pdus_by_name, pdus_by_ip = {}, {}
+        for p in tracked_pdus:
+            pdus_by_name[p.get("hostname", "").lower()] = p
+            pdu_ip = p.get("ip")
+            if pdu_ip:
+                pdus_by_ip[pdu_ip] = p
+
+        _lookup_cache["data"] = (
+            tracked_systems, tracked_pdus,
+            systems_by_name, systems_by_ip,
+            pdus_by_name, pdus_by_ip,
+        )
+        _lookup_cache["loaded_at"] = now
+        _lookup_cache["generation"] = generation
+
+    return _lookup_cache["data"]
+
+
+def invalidate_tracked_lookups():
+    """Drop cached lookups in every worker after systems/pdus are modified."""
+    _lookup_cache["data"] = None
+    try:
+        redis.incr(LOOKUP_GENERATION_KEY)
+    except Exception as e:
+        log.warning("Could not bump lookup generation in Redis: %s", e)
+
+
+def compare_with_database(scanned_devices):
+    (tracked_systems, tracked_pdus,
+     systems_by_name, systems_by_ip,
+     pdus_by_name, pdus_by_ip) = get_tracked_lookups()
 
     analysis = {
         "new_systems": [],
@@ -270,20 +507,16 @@ def compare_with_database(scanned_devices):
     # Systems (BMC hostname logic)
     # ----------------------------
     for d in scanned_devices["systems"]:
-        bmc_hostname = d["hostname"].lower()
+        bmc_hostname = device_hostname_lc(d)
         ip = d["ip"]
  
         # Clean the scanned BMC hostname to get the bare system name.
         # e.g. "bmc-gbt350-odcdh5-wbb1-b.amd.com" → "gbt350-odcdh5-wbb1-b"
         cleaned_bmc = bmc_hostname.replace("bmc-", "").replace(".amd.com", "")
  
-        matched_by_name = None
-        for system_name, system_record in systems_by_name.items():
-            # Exact match only — avoids "gbt350-odcdh5-wbb1" matching
-            # "gbt350-odcdh5-wbb1-b" as a substring.
-            if system_name == cleaned_bmc:
-                matched_by_name = system_record
-                break
+        # Exact match only — avoids "gbt350-odcdh5-wbb1" matching
+        # "gbt350-odcdh5-wbb1-b" as a substring.
+        matched_by_name = systems_by_name.get(cleaned_bmc)
  
         if matched_by_name:
             matched_system_ids.add(str(matched_by_name.get("_id")))
@@ -318,7 +551,7 @@ def compare_with_database(scanned_devices):
     # ----------------------------
     # Possible system resets
     # ----------------------------
-    for d in scanned_devices["non_standard"] + scanned_devices["no_hostname"]:
+    for d in chain(scanned_devices["non_standard"], scanned_devices["no_hostname"]):
         ip = d["ip"]
         if ip in systems_by_ip and ip not in matched_ips:
             s = systems_by_ip[ip]
@@ -337,7 +570,7 @@ def compare_with_database(scanned_devices):
 
     for d in scanned_devices["pdus"]:
         hostname = d["hostname"]
-        name = hostname.lower()
+        name = device_hostname_lc(d)
         ip = d["ip"]
 
         if name in pdus_by_name:
@@ -426,6 +659,7 @@ def update_system():
             update_data["location"] = location
  
         update_result = db.update(system_id, update_data, "systems")
+        invalidate_tracked_lookups()
  
         # Log the change
         change_log = ChangeLog()
@@ -492,6 +726,8 @@ def update_hostname():
  
         else:
             return jsonify({"status": "error", "message": "Invalid entity_type"}), 400
+
+        invalidate_tracked_lookups()
  
         # Log the change
         new_values = {"hostname": new_hostname}
@@ -562,6 +798,7 @@ def create_system():
         }
         
         inserted_id = db.insert(new_system_data, "systems")
+        invalidate_tracked_lookups()
         
         # Log the change - exclude datetime fields from new_values to avoid
         # serialization issues when the change log is later retrieved
@@ -627,6 +864,7 @@ def create_pdu():
         }
         
         result = pdu_model.create(new_pdu_data)
+        invalidate_tracked_lookups()
         
         # Extract the inserted ID
         inserted_id = result.split("Inserted Id ")[-1] if "Inserted Id" in result else None
@@ -837,6 +1075,7 @@ def move_to_disabled():
 
         # Remove from active collection
         db.delete(entity_id, collection)
+        invalidate_tracked_lookups()
 
         change_log = ChangeLog()
         change_log.create({
@@ -881,6 +1120,7 @@ def restore_from_disabled():
 
         db = Database()
         db.insert(original_data, collection)
+        invalidate_tracked_lookups()
 
         disabled_model.delete(disabled_id)
 
@@ -903,24 +1143,49 @@ def restore_from_disabled():
 
 
 # -------------------------------------------------------------------
-# Routes
+# Background scan jobs
 # -------------------------------------------------------------------
 
-@nmap_scan.route("/scan", methods=["POST"])
-def run_nmap_scan():
-    networks = [
-        "10.145.71.0/24",
-        "10.145.70.0/24",
-        "10.145.69.0/24",
-        "10.145.132.0/24",
-        "10.145.133.0/24",
-        "10.145.135.0/24",
-    ]
+SCAN_NETWORKS = [
+    "10.145.71.0/24",
+    "10.145.70.0/24",
+    "10.145.69.0/24",
+    "10.145.132.0/24",
+    "10.145.133.0/24",
+    "10.145.135.0/24",
+]
+
+# Job state lives in Redis so any gunicorn worker can answer the poll
+SCAN_JOB_KEY_PREFIX = "nmap_scan:job:"
+SCAN_JOB_TTL_SECONDS = 3600
+# Task id of the sweep in flight; POST /scan joins it instead of starting
+# another. Expires just past the scanner service timeout (310s) so a claim
+# left by a dead worker does not block new scans for long.
+SCAN_ACTIVE_JOB_KEY = "nmap_scan:active_job"
+SCAN_ACTIVE_JOB_TTL_SECONDS = 330
+
+_scan_executor = ThreadPoolExecutor(max_workers=2)
+
+
+def _store_scan_job(task_id, payload, http_status=200):
+    redis.setex(
+        f"{SCAN_JOB_KEY_PREFIX}{task_id}",
+        SCAN_JOB_TTL_SECONDS,
+        json.dumps({"http_status": http_status, "payload": payload}, default=str)
+    )
 
+
+def _load_scan_job(task_id):
+    raw = redis.get(f"{SCAN_JOB_KEY_PREFIX}{task_id}")
+    return json.loads(raw) if raw else None
+
+
+def perform_scan(networks):
+    """Run the scan + DB comparison. Returns (payload, http_status)."""
     try:
         # Windows scanner service
         if is_windows_with_scanner_service():
-            resp = requests.post(
+            resp = _scanner_session.post(
                 f"{get_scanner_service_url()}/scan",
                 json={"networks": networks},
                 timeout=310
@@ -928,34 +1193,118 @@ def run_nmap_scan():
             resp.raise_for_status()
             scanned_devices = resp.json()["scanned_devices"]
 
-        # Local nmap
+        # Local ICMP sweep / nmap
         else:
-            cmd = ["nmap", "-sn", "-R"] + networks
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
+            scanned_devices, errors = scan_networks_local(networks)
 
-            if result.returncode != 0:
-                return jsonify({
+            if errors:
+                return {
                     "status": "error",
-                    "message": result.stderr
-                }), 500
-
-            scanned_devices = parse_nmap_output(result.stdout)
+                    "message": "; ".join(errors)
+                }, 500
 
         # Filter out ignored devices
         scanned_devices = filter_ignored_devices(scanned_devices)
         
         analysis = compare_with_database(scanned_devices)
 
-        return jsonify({
+        return {
             "status": "success",
             "scanned_devices": scanned_devices,
             "analysis": analysis
-        })
+        }, 200
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": str(e)
+        }, 500
+
+
+def _claim_scan_job():
+    """
+    Return (task_id, is_new). Reuses the in-flight job's id when a sweep is
+    already running, otherwise claims SCAN_ACTIVE_JOB_KEY for a new id.
+    """
+    task_id = uuid.uuid4().hex
+    for _ in range(2):
+        if redis.set(SCAN_ACTIVE_JOB_KEY, task_id, nx=True, ex=SCAN_ACTIVE_JOB_TTL_SECONDS):
+            return task_id, True
+
+        active = redis.get(SCAN_ACTIVE_JOB_KEY)
+        if not active:
+            continue
+        active = active.decode()
+        job = _load_scan_job(active)
+        # No record yet means the claiming request has not stored it yet
+        if job is None or job["payload"].get("status") == "running":
+            return active, False
+        # The job finished but its claim was never released
+        redis.delete(SCAN_ACTIVE_JOB_KEY)
+
+    return task_id, True
+
+
+def _release_scan_job(task_id):
+    try:
+        active = redis.get(SCAN_ACTIVE_JOB_KEY)
+        if active and active.decode() == task_id:
+            redis.delete(SCAN_ACTIVE_JOB_KEY)
+    except Exception as e:
+        log.warning("Could not release scan job %s: %s", task_id, e)
+
+
+def _run_scan_job(task_id, networks):
+    try:
+        payload, http_status = perform_scan(networks)
+        _store_scan_job(task_id, payload, http_status)
+    except Exception as e:
+        log.error("Scan job %s failed: %s", task_id, e)
+        _store_scan_job(task_id, {"status": "error", "message": str(e)}, 500)
+    finally:
+        _release_scan_job(task_id)
+
+
+# -------------------------------------------------------------------
+# Routes
+# -------------------------------------------------------------------
+
+@nmap_scan.route("/scan", methods=["POST"])
+def run_nmap_scan():
+    """
+    Queue a scan and return its task id; poll /scan/result/<task_id>.
+    While a scan is running, further requests get that scan's task id.
+    """
+    try:
+        task_id, is_new = _claim_scan_job()
+        if is_new:
+            _store_scan_job(task_id, {"status": "running", "task_id": task_id})
+            _scan_executor.submit(_run_scan_job, task_id, SCAN_NETWORKS)
+
+        return jsonify({
+            "status": "pending",
+            "task_id": task_id
+        }), 202
+
+    except Exception as e:
+        return jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 500
+
+
+@nmap_scan.route("/scan/result/<task_id>", methods=["GET"])
+def get_scan_result(task_id):
+    """Return the scan payload once finished, or {"status": "running"}."""
+    try:
+        job = _load_scan_job(task_id)
+        if job is None:
+            return jsonify({
+                "status": "error",
+                "message": f"Unknown scan task {task_id}"
+            }), 404
+
+        return jsonify(job["payload"]), job["http_status"]
 
     except Exception as e:
         return jsonify({
@@ -968,7 +1317,7 @@ def run_nmap_scan():
 def scan_status():
     try:
         if is_windows_with_scanner_service():
-            r = requests.get(f"{get_scanner_service_url()}/status", timeout=5)
+            r = _scanner_session.get(f"{get_scanner_service_url()}/status", timeout=5)
             r.raise_for_status()
             return jsonify({
                 "status": "available",
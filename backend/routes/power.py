@@ -1,4 +1,5 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from flask import Blueprint, request
 from utils.models.power import Power
@@ -18,22 +19,33 @@ def get_date_batches(start_date, end_date, max_days=7):
     
     return batches
 
+# Concurrent batch queries; pymongo's pool gives each thread its own socket
+MAX_BATCH_WORKERS = 8
+
 def query_power_in_batches(power_model, query_filter, start_date, end_date, max_days=7):
     """Query power data in batches to avoid large date range errors"""
     adjusted_end_date = end_date + timedelta(days=1)
     batches = get_date_batches(start_date, adjusted_end_date, max_days)
-    all_results = []
     
-    for batch_start, batch_end in batches:
+    def query_batch(batch):
+        batch_start, batch_end = batch
         batch_filter = query_filter.copy()
         batch_filter["created"] = {"$gte": batch_start, "$lt": batch_end}
         
         try:
-            batch_results = power_model.find(batch_filter, sort=[("created", 1)])
-            all_results.extend(batch_results)
+            return power_model.find(batch_filter, sort=[("created", 1)])
         except Exception as e:
             print(f"Error querying batch {batch_start} to {batch_end}: {e}")
-            continue
+            return []
+    
+    if len(batches) <= 1:
+        return query_batch(batches[0]) if batches else []
+    
+    # Batches run in parallel; map() keeps them in chronological order
+    all_results = []
+    with ThreadPoolExecutor(max_workers=min(MAX_BATCH_WORKERS, len(batches))) as executor:
+        for batch_results in executor.map(query_batch, batches):
+            all_results.extend(batch_results)
     
     return all_results
 
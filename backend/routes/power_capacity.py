@@ -1,10 +1,16 @@
 import json
 import os
+import threading
 from datetime import datetime, timedelta
 from flask import Blueprint, request, jsonify
 from dateutil.relativedelta import relativedelta
 from utils.models.power import Power
-from collections import defaultdict
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to the stdlib json module
+    orjson = None
 
 power_capacity = Blueprint("power_capacity", __name__)
 
@@ -18,163 +24,231 @@ PLANNED_CAPACITY = {
     "odcdh5": 209
 }
 
+# (site, column prefix) pairs used in the capacity rows
+SITE_COLUMNS = (
+    ("odcdh1", "dh1"),
+    ("odcdh2", "dh2"),
+    ("odcdh3", "dh3"),
+    ("odcdh4", "dh4"),
+    ("odcdh5", "dh5"),
+)
+SITES = tuple(site for site, _ in SITE_COLUMNS)
+COLUMN_MAP = dict(SITE_COLUMNS)
+TOTAL_PLANNED = sum(PLANNED_CAPACITY.values())
+
+def build_capacity_row(month, live_kw_by_col, historical_max, total_live=None):
+    """
+    One capacity row: planned/live/max/available per site plus totals.
+    `live_kw_by_col` maps "dh1".. to live kW; `total_live` defaults to the
+    rounded sum of those values.
+    """
+    row = {"month": month}
+    live_sum = 0.0
+    for site, col in SITE_COLUMNS:
+        planned = PLANNED_CAPACITY[site]
+        live_kw = live_kw_by_col.get(col, 0)
+        max_kw  = max(live_kw, historical_max.get(f"{col}_max", 0))
+
+        row[f"{col}_planned"]   = planned
+        row[f"{col}_live"]      = live_kw
+        row[f"{col}_max"]       = max_kw
+        row[f"{col}_available"] = round(planned - max_kw, 2)
+        live_sum += live_kw
+
+    if total_live is None:
+        total_live = round(live_sum, 2)
+
+    row["total_planned"]   = TOTAL_PLANNED
+    row["total_live"]      = total_live
+    row["total_max"]       = round(max(total_live, historical_max.get("total_max", 0)), 2)
+    row["total_available"] = round(row["total_planned"] - row["total_max"], 2)
+    return row
+
 def ensure_data_directory():
     data_dir = os.path.dirname(DATA_FILE_PATH)
     if not os.path.exists(data_dir):
         os.makedirs(data_dir)
 
+# Parsed JSON file + derived historical max, reused until the file changes
+_capacity_cache = {"stamp": None, "data": [], "historical_max": None}
+
+def _data_file_stamp():
+    """(mtime_ns, size) of the JSON file, or None if it doesn't exist."""
+    try:
+        st = os.stat(DATA_FILE_PATH)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
 def load_capacity_data():
     try:
-        if os.path.exists(DATA_FILE_PATH):
-            with open(DATA_FILE_PATH, 'r') as f:
-                return json.load(f)
-        return []
+        stamp = _data_file_stamp()
+        if stamp is None:
+            return []
+        if stamp != _capacity_cache["stamp"]:
+            if orjson:
+                with open(DATA_FILE_PATH, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(DATA_FILE_PATH, 'r') as f:
+                    data = json.load(f)
+            _capacity_cache.update(stamp=stamp, data=data, historical_max=None)
+        # Callers append to the list before saving; don't hand out the cached one
+        return list(_capacity_cache["data"])
     except Exception as e:
         print(f"Error loading capacity data: {e}")
         return []
 
 def save_capacity_data(data):
+    # Write a staging file next to the real one and rename it into place, so
+    # readers (and a crash mid-write) never see a truncated JSON file.
+    # The pid suffix keeps concurrent gunicorn workers off each other's file.
+    tmp_path = f"{DATA_FILE_PATH}.{os.getpid()}.tmp"
     try:
         ensure_data_directory()
-        with open(DATA_FILE_PATH, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        if orjson:
+            # Same 2-space layout as json.dump; datetimes serialize natively
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f, indent=2, default=str)
+        os.replace(tmp_path, DATA_FILE_PATH)
         return True
     except Exception as e:
         print(f"Error saving capacity data: {e}")
-        return False
-
-def get_date_batches(start_date, end_date, max_days=7):
-    batches = []
-    current_start = start_date
-    while current_start < end_date:
-        current_end = min(current_start + timedelta(days=max_days), end_date)
-        batches.append((current_start, current_end))
-        current_start = current_end
-    return batches
-
-def query_power_in_batches(power_model, query_filter, start_date, end_date, max_days=7):
-    adjusted_end_date = end_date + timedelta(days=1)
-    batches = get_date_batches(start_date, adjusted_end_date, max_days)
-    all_results = []
-    for batch_start, batch_end in batches:
-        batch_filter = query_filter.copy()
-        batch_filter["created"] = {"$gte": batch_start, "$lt": batch_end}
         try:
-            batch_results = power_model.find(batch_filter, sort=[("created", 1)])
-            all_results.extend(batch_results)
-        except Exception as e:
-            print(f"Error querying batch {batch_start} to {batch_end}: {e}")
-            continue
-    return all_results
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
 
 def calculate_live_capacity_for_month(start_date, end_date):
     """
     Full DB scan: used only on cold-start (Redis empty).
     Calculates live capacity = peak daily sum of per-system max readings.
+    The grouping runs inside MongoDB, so only one row per site comes back.
     """
-    sites = ["odcdh1", "odcdh2", "odcdh3", "odcdh4", "odcdh5"]
     power_model = Power()
+    collection = power_model.db.db[power_model.collection_name]
     result = {"month": start_date.strftime("%B %Y")}
-    column_map = {"odcdh1": "dh1", "odcdh2": "dh2", "odcdh3": "dh3", "odcdh4": "dh4", "odcdh5": "dh5"}
     total_live_capacity = 0
 
-    for site in sites:
-        try:
-            readings = query_power_in_batches(power_model, {"site": site}, start_date, end_date, max_days=3)
-            if not readings:
-                continue
-
-            daily_system_readings = defaultdict(lambda: defaultdict(list))
-            for reading in readings:
-                try:
-                    timestamp = reading.get("created")
-                    if isinstance(timestamp, str):
-                        timestamp = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                    day_key = timestamp.date()
-                    system = reading.get("system", reading.get("location", "unknown"))
-                    daily_system_readings[day_key][system].append(reading.get("reading", 0))
-                except Exception:
-                    continue
-
-            daily_sums = []
-            for day, systems_data in daily_system_readings.items():
-                day_sum = sum(max(power_readings) for power_readings in systems_data.values())
-                daily_sums.append(day_sum)
-
-            if daily_sums:
-                live_capacity_kw = max(daily_sums) / 1000
-                col = column_map[site]
-                result[f"{col}_live"] = round(live_capacity_kw, 2)
-                total_live_capacity += live_capacity_kw
-
-        except Exception as e:
-            print(f"Error calculating live capacity for {site}: {e}")
+    pipeline = [
+        {"$match": {
+            "site": {"$in": list(SITES)},
+            "created": {"$gte": start_date, "$lt": end_date + timedelta(days=1)},
+        }},
+        # Max reading per (site, day, system)
+        {"$group": {
+            "_id": {
+                "site": "$site",
+                "day": {"$dateToString": {"format": "%Y-%m-%d", "date": "$created"}},
+                "system": {"$ifNull": ["$system", {"$ifNull": ["$location", "unknown"]}]},
+            },
+            "system_max": {"$max": {"$ifNull": ["$reading", 0]}},
+        }},
+        # Sum of per-system maxima per (site, day)
+        {"$group": {
+            "_id": {"site": "$_id.site", "day": "$_id.day"},
+            "day_sum": {"$sum": "$system_max"},
+        }},
+        # Peak daily sum per site
+        {"$group": {"_id": "$_id.site", "live": {"$max": "$day_sum"}}},
+    ]
+
+    try:
+        rows = list(collection.aggregate(pipeline, allowDiskUse=True))
+    except Exception as e:
+        print(f"Error calculating live capacity: {e}")
+        rows = []
+
+    for row in rows:
+        col = COLUMN_MAP.get(row["_id"])
+        if col is None or row.get("live") is None:
             continue
+        live_capacity_kw = row["live"] / 1000
+        result[f"{col}_live"] = round(live_capacity_kw, 2)
+        total_live_capacity += live_capacity_kw
 
     result["total_live"] = round(total_live_capacity, 2)
     return result
 
 
 def calculate_historical_max_capacity():
-    """Read historical max from JSON file – O(months) but months is small."""
+    """Read historical max from JSON file – recomputed only when the file changes."""
     historical_data = load_capacity_data()
     if not historical_data:
         return {}
+    if _capacity_cache["historical_max"] is not None:
+        return dict(_capacity_cache["historical_max"])
+    stamp = _capacity_cache["stamp"]
 
-    sites = ["dh1", "dh2", "dh3", "dh4", "dh5"]
     max_capacities = {}
-    for site in sites:
+    for _, col in SITE_COLUMNS:
         site_max = max(
-            (m.get(f"{site}_live", 0) for m in historical_data),
+            (m.get(f"{col}_live", 0) for m in historical_data),
             default=0
         )
-        max_capacities[f"{site}_max"] = site_max
+        max_capacities[f"{col}_max"] = site_max
 
     max_capacities["total_max"] = sum(max_capacities.values())
-    return max_capacities
+    if _capacity_cache["stamp"] == stamp:
+        _capacity_cache["historical_max"] = max_capacities
+    return dict(max_capacities)
+
+
+# "YYYY-MM" of the previous month once it is known to be saved, so the
+# GET routes skip the check for the rest of the month
+_auto_save_done_for = None
+_auto_save_lock = threading.Lock()
 
 
 def auto_save_previous_month():
+    global _auto_save_done_for
+
+    current_date = datetime.now()
+    first_day_current = datetime(current_date.year, current_date.month, 1)
+    first_day_previous = first_day_current - relativedelta(months=1)
+    month_key = first_day_previous.strftime("%Y-%m")
+    if _auto_save_done_for == month_key:
+        return
+
+    # Another request is already saving; don't stack up month scans
+    if not _auto_save_lock.acquire(blocking=False):
+        return
     try:
-        current_date = datetime.now()
-        first_day_current = datetime(current_date.year, current_date.month, 1)
-        first_day_previous = first_day_current - relativedelta(months=1)
-        previous_month = first_day_previous.strftime("%B %Y")
+        _save_previous_month(first_day_previous, first_day_current)
+        _auto_save_done_for = month_key
+    except Exception as e:
+        print(f"Error in auto-save previous month capacity: {e}")
+    finally:
+        _auto_save_lock.release()
 
-        existing_data = load_capacity_data()
-        if any(item.get('month') == previous_month for item in existing_data):
-            return
 
-        print(f"Auto-saving capacity data for {previous_month}")
-        live_capacity_data = calculate_live_capacity_for_month(first_day_previous, first_day_current)
-        historical_max = calculate_historical_max_capacity()
+def _save_previous_month(first_day_previous, first_day_current):
+    """Append the previous month's capacity row unless it's already saved."""
+    previous_month = first_day_previous.strftime("%B %Y")
 
-        capacity_data = {"month": previous_month}
-        for site_key, col in {"odcdh1": "dh1", "odcdh2": "dh2", "odcdh3": "dh3",
-                               "odcdh4": "dh4", "odcdh5": "dh5"}.items():
-            live = live_capacity_data.get(f"{col}_live", 0)
-            hist = historical_max.get(f"{col}_max", 0)
-            max_v = max(live, hist)
-            capacity_data[f"{col}_planned"]   = PLANNED_CAPACITY[site_key]
-            capacity_data[f"{col}_live"]      = live
-            capacity_data[f"{col}_max"]       = max_v
-            capacity_data[f"{col}_available"] = round(PLANNED_CAPACITY[site_key] - max_v, 2)
-
-        capacity_data["total_planned"]   = sum(PLANNED_CAPACITY.values())
-        capacity_data["total_live"]      = live_capacity_data.get("total_live", 0)
-        capacity_data["total_max"]       = max(live_capacity_data.get("total_live", 0),
-                                               historical_max.get("total_max", 0))
-        capacity_data["total_available"] = round(
-            capacity_data["total_planned"] - capacity_data["total_max"], 2
-        )
-        capacity_data["auto_saved"]  = True
-        capacity_data["saved_date"]  = datetime.now().isoformat()
+    existing_data = load_capacity_data()
+    if any(item.get('month') == previous_month for item in existing_data):
+        return
 
-        existing_data.append(capacity_data)
-        save_capacity_data(existing_data)
+    print(f"Auto-saving capacity data for {previous_month}")
+    live_capacity_data = calculate_live_capacity_for_month(first_day_previous, first_day_current)
+    historical_max = calculate_historical_max_capacity()
 
-    except Exception as e:
-        print(f"Error in auto-save previous month capacity: {e}")
+    live_kw_by_col = {col: live_capacity_data.get(f"{col}_live", 0) for _, col in SITE_COLUMNS}
+    capacity_data = build_capacity_row(
+        previous_month, live_kw_by_col, historical_max,
+        total_live=live_capacity_data.get("total_live", 0)
+    )
+    capacity_data["auto_saved"]  = True
+    capacity_data["saved_date"]  = datetime.now().isoformat()
+
+    existing_data.append(capacity_data)
+    if not save_capacity_data(existing_data):
+        raise RuntimeError("could not write capacity data file")
 
 
 @power_capacity.route("", methods=["GET"])
@@ -209,10 +283,6 @@ def get_current_previous():
         previous_month     = first_day_previous.strftime("%B %Y")
         month_str          = first_day_current.strftime("%Y-%m")
 
-        sites   = ["odcdh1", "odcdh2", "odcdh3", "odcdh4", "odcdh5"]
-        col_map = {"odcdh1": "dh1", "odcdh2": "dh2", "odcdh3": "dh3",
-                   "odcdh4": "dh4", "odcdh5": "dh5"}
-
         def redis_float(key):
             v = r_client.get(key)
             if v is None:
@@ -222,19 +292,19 @@ def get_current_previous():
         # ── Step 1: read live capacities from Redis (O(1)) ───────────────────
         live_kw_by_col: dict = {}
         all_cached = True
-        for site in sites:
+        for site in SITES:
             w = redis_float(f"cap:month_live:{site}:{month_str}")
             if w is None:
                 all_cached = False
                 break
-            live_kw_by_col[col_map[site]] = round(w / 1000.0, 2)
+            live_kw_by_col[COLUMN_MAP[site]] = round(w / 1000.0, 2)
 
         # ── Step 2: cold-start fallback – calculate from DB + seed Redis ─────
         if not all_cached:
             print("Capacity Redis miss – one-time DB scan, will cache result")
             live_data = calculate_live_capacity_for_month(first_day_current, current_date)
-            for site in sites:
-                col = col_map[site]
+            for site in SITES:
+                col = COLUMN_MAP[site]
                 kw  = live_data.get(f"{col}_live", 0)
                 live_kw_by_col[col] = kw
                 # Store in Watts (consistent with Celery writer)
@@ -248,29 +318,7 @@ def get_current_previous():
         historical_max = calculate_historical_max_capacity()
 
         # ── Step 4: assemble current-month response ───────────────────────────
-        current_data: dict = {"month": current_month}
-        total_live = 0.0
-        for site in sites:
-            col      = col_map[site]
-            planned  = PLANNED_CAPACITY[site]
-            live_kw  = live_kw_by_col.get(col, 0.0)
-            hist_max = historical_max.get(f"{col}_max", 0.0)
-            max_kw   = max(live_kw, hist_max)
-
-            current_data[f"{col}_planned"]   = planned
-            current_data[f"{col}_live"]      = live_kw
-            current_data[f"{col}_max"]       = max_kw
-            current_data[f"{col}_available"] = round(planned - max_kw, 2)
-            total_live += live_kw
-
-        current_data["total_planned"]   = sum(PLANNED_CAPACITY.values())
-        current_data["total_live"]      = round(total_live, 2)
-        current_data["total_max"]       = round(
-            max(total_live, historical_max.get("total_max", 0.0)), 2
-        )
-        current_data["total_available"] = round(
-            current_data["total_planned"] - current_data["total_max"], 2
-        )
+        current_data = build_capacity_row(current_month, live_kw_by_col, historical_max)
 
         # ── Step 5: previous month from saved JSON (already O(1)) ────────────
         existing_data = load_capacity_data()
@@ -5,19 +5,89 @@ Runs on Windows host (outside Docker) and provides nmap scanning via HTTP API.
 """
 
 import subprocess
-import re
+import socket
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import platform
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to Flask's stdlib json provider
+    orjson = None
+
+try:
+    from waitress import serve
+except ImportError:
+    # waitress is optional; fall back to Flask's threaded dev server
+    serve = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Serialize responses with orjson; large device lists encode much faster."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=str).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+if orjson:
+    app.json = OrjsonProvider(app)
 CORS(app)  # Allow requests from Docker containers
 
+NMAP_REPORT_PREFIX = "Nmap scan report for "
+NMAP_TIMEOUT_SECONDS = 300  # 5 minute timeout
+# Same probe options as NMAP_SWEEP_ARGS in routes/nmap_scan.py. Unlike the
+# backend, which adds -n and resolves names itself, the service lets nmap
+# reverse-resolve the live hosts (its default; -R would also resolve the down
+# addresses) and reads the names from the "Nmap scan report for" lines.
+NMAP_SWEEP_ARGS = ["-sn", "-T4", "--min-hostgroup", "256", "--min-parallelism", "64"]
+# Request threads: a running /scan holds one, the rest serve /health and /status
+SERVER_THREADS = 8
+
+def parse_report_line(line):
+    """
+    Split an nmap report line into (hostname, ip) without a regex:
+      "Nmap scan report for host.name (1.2.3.4)" -> ("host.name", "1.2.3.4")
+      "Nmap scan report for 1.2.3.4"             -> (None, "1.2.3.4")
+    ip is None if the address is not a valid dotted quad.
+    """
+    rest = line[len(NMAP_REPORT_PREFIX):].rstrip()
+    hostname = None
+    if rest.endswith(")"):
+        hostname, _, ip = rest[:-1].rpartition(" (")
+    else:
+        ip = rest
+
+    # inet_aton also accepts short forms like "10.1", so require 4 parts
+    if ip.count(".") != 3:
+        return hostname, None
+    try:
+        socket.inet_aton(ip)
+    except OSError:
+        return hostname, None
+    return hostname or None, ip
+
 def parse_nmap_output(output):
     """
     Parse nmap output and categorize devices.
     Returns dict with categorized devices.
     """
+    return parse_nmap_lines(output.split('\n'))
+
+def parse_nmap_lines(lines):
+    """
+    Single-pass parser over any iterable of nmap output lines, so it can
+    consume nmap's stdout while the scan is still running.
+    Returns dict with categorized devices.
+    """
     devices = {
         "systems": [],
         "pdus": [],
@@ -25,15 +95,13 @@ def parse_nmap_output(output):
         "no_hostname": []
     }
     
-    lines = output.split('\n')
     current_ip = None
     current_hostname = None
     host_is_up = False
     
     for line in lines:
-        # Match lines with hostname and IP
-        hostname_match = re.search(r'Nmap scan report for ([^\s]+) \((\d+\.\d+\.\d+\.\d+)\)', line)
-        if hostname_match:
+        # Only report and "Host is up" lines matter; everything else is skipped
+        if line.startswith(NMAP_REPORT_PREFIX):
             if current_ip and host_is_up:
                 if current_hostname:
                     categorize_device(devices, current_ip, current_hostname)
@@ -43,31 +111,11 @@ def parse_nmap_output(output):
                         "hostname": None
                     })
             
-            current_hostname = hostname_match.group(1)
-            current_ip = hostname_match.group(2)
+            current_hostname, current_ip = parse_report_line(line)
             host_is_up = False
-            continue
-        
-        # Match lines with only IP
-        ip_match = re.search(r'Nmap scan report for (\d+\.\d+\.\d+\.\d+)$', line)
-        if ip_match:
-            if current_ip and host_is_up:
-                if current_hostname:
-                    categorize_device(devices, current_ip, current_hostname)
-                else:
-                    devices["no_hostname"].append({
-                        "ip": current_ip,
-                        "hostname": None
-                    })
-            
-            current_ip = ip_match.group(1)
-            current_hostname = None
-            host_is_up = False
-            continue
-        
-        if "Host is up" in line:
+
+        elif line.startswith("Host is up"):
             host_is_up = True
-            continue
     
     # Process last device
     if current_ip and host_is_up:
@@ -84,15 +132,102 @@ def parse_nmap_output(output):
 def categorize_device(devices, ip, hostname):
     """Categorize a device based on its hostname."""
     hostname_lower = hostname.lower() if hostname else ""
-    device_info = {"ip": ip, "hostname": hostname}
+    device_info = {"ip": ip, "hostname": hostname, "hostname_lc": hostname_lower}
     
-    if "bmc" in hostname_lower:
+    # Keep in sync with categorize_device in routes/nmap_scan.py
+    if hostname_lower.startswith("bmc-"):
         devices["systems"].append(device_info)
-    elif "pdu" in hostname_lower:
+    elif hostname_lower.startswith("pdu-"):
         devices["pdus"].append(device_info)
     else:
         devices["non_standard"].append(device_info)
 
+def _collect_lines(lines, sink):
+    """Pass lines through while keeping a copy for raw_output."""
+    for line in lines:
+        sink.append(line)
+        yield line
+
+def run_nmap(networks, include_raw_output=False):
+    """
+    Run nmap and parse its stdout line by line as hosts are reported.
+    Returns (scanned_devices, returncode, stderr, raw_output).
+    Raises subprocess.TimeoutExpired if the scan runs too long.
+    """
+    cmd = ["nmap"] + NMAP_SWEEP_ARGS + networks
+    
+    print(f"Executing: {' '.join(cmd)}")
+    
+    # stderr goes to a temp file: a pipe read only after stdout's EOF would
+    # let a burst of nmap warnings fill it and stall the report stream
+    with tempfile.TemporaryFile() as stderr_file:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+            text=True,
+            bufsize=1
+        )
+        
+        # Enforce the timeout while stdout is still being consumed
+        timed_out = threading.Event()
+        def kill_nmap():
+            timed_out.set()
+            proc.kill()
+        watchdog = threading.Timer(NMAP_TIMEOUT_SECONDS, kill_nmap)
+        watchdog.start()
+        
+        raw_lines = [] if include_raw_output else None
+        try:
+            lines = proc.stdout if raw_lines is None else _collect_lines(proc.stdout, raw_lines)
+            scanned_devices = parse_nmap_lines(lines)
+            returncode = proc.wait()
+        finally:
+            watchdog.cancel()
+            proc.stdout.close()
+        
+        stderr_file.seek(0)
+        stderr = stderr_file.read().decode("utf-8", errors="replace")
+    
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, NMAP_TIMEOUT_SECONDS)
+    
+    raw_output = "".join(raw_lines) if raw_lines is not None else None
+    return scanned_devices, returncode, stderr, raw_output
+
+def run_nmap_parallel(networks, include_raw_output=False):
+    """
+    Run one streamed nmap per network concurrently (nmap walks its own
+    target list serially) and merge the categorized results.
+    Returns (scanned_devices, returncode, stderr, raw_output) like run_nmap;
+    returncode is the first non-zero exit code, stderr is tagged per network.
+    Raises subprocess.TimeoutExpired if any scan runs too long.
+    """
+    if len(networks) <= 1:
+        return run_nmap(networks, include_raw_output)
+    
+    with ThreadPoolExecutor(max_workers=len(networks)) as executor:
+        results = list(executor.map(
+            lambda network: run_nmap([network], include_raw_output),
+            networks
+        ))
+    
+    scanned_devices = {"systems": [], "pdus": [], "non_standard": [], "no_hostname": []}
+    returncode = 0
+    errors = []
+    raw_outputs = []
+    for network, (devices, code, stderr, raw_output) in zip(networks, results):
+        for category, entries in devices.items():
+            scanned_devices[category].extend(entries)
+        if code != 0:
+            returncode = returncode or code
+            errors.append(f"{network}: {stderr.strip() or f'nmap exited with {code}'}")
+        if raw_output is not None:
+            raw_outputs.append(raw_output)
+    
+    raw_output = "".join(raw_outputs) if include_raw_output else None
+    return scanned_devices, returncode, "; ".join(errors), raw_output
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
@@ -117,41 +252,31 @@ def run_scan():
         
         print(f"Scanning networks: {networks}")
         
-        # Build nmap command
-        cmd = ["nmap", "-sn", "-R"] + networks
-        
-        print(f"Executing: {' '.join(cmd)}")
-        
-        # Execute nmap with timeout
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
+        # One nmap per network, each parsed as it produces output
+        scanned_devices, returncode, stderr, raw_output = run_nmap_parallel(
+            networks,
+            include_raw_output=bool(data.get('include_raw_output'))
         )
         
-        if result.returncode != 0:
-            print(f"Nmap error: {result.stderr}")
+        if returncode != 0:
+            print(f"Nmap error: {stderr}")
             return jsonify({
                 "status": "error",
-                "message": f"Nmap command failed: {result.stderr}"
+                "message": f"Nmap command failed: {stderr}"
             }), 500
         
-        print("Nmap scan completed, parsing output...")
-        
-        # Parse output
-        scanned_devices = parse_nmap_output(result.stdout)
-        
         print(f"Found {len(scanned_devices['systems'])} systems, "
               f"{len(scanned_devices['pdus'])} PDUs, "
               f"{len(scanned_devices['non_standard'])} non-standard, "
               f"{len(scanned_devices['no_hostname'])} no hostname")
         
-        return jsonify({
+        response = {
             "status": "success",
-            "scanned_devices": scanned_devices,
-            "raw_output": result.stdout  # Include for debugging
-        })
+            "scanned_devices": scanned_devices
+        }
+        if raw_output is not None:
+            response["raw_output"] = raw_output  # Include for debugging
+        return jsonify(response)
         
     except subprocess.TimeoutExpired:
         return jsonify({
@@ -217,4 +342,7 @@ if __name__ == '__main__':
     print("")
     
     # Run on port 5001 to avoid conflict with backend
-    app.run(host='0.0.0.0', port=5001, debug=False)
\ No newline at end of file
+    if serve:
+        serve(app, host='0.0.0.0', port=5001, threads=SERVER_THREADS)
+    else:
+        app.run(host='0.0.0.0', port=5001, debug=False, threaded=True)
\ No newline at end of file
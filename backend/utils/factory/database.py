@@ -73,6 +73,10 @@ class Database(object):
         if updated.matched_count == 1:
             return "Record Successfully Updated"
 
+    def create_index(self, collection_name, keys, **kwargs):
+        # No-op on the server if an identical index already exists
+        return self.db[collection_name].create_index(keys, **kwargs)
+
     def delete(self, id, collection_name):
         deleted = self.db[collection_name].delete_one({"_id": ObjectId(id)})
         return bool(deleted.deleted_count)
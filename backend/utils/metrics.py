@@ -0,0 +1,51 @@
+import os
+
+try:
+    from prometheus_client import Counter, Histogram
+except Exception:
+    # prometheus_client may not be available in all environments
+    Counter = Histogram = None
+
+# HTTP metrics
+if Counter:
+    HTTP_REQ_COUNTER = Counter(
+        "http_requests_total",
+        "Total HTTP requests",
+        ["endpoint", "method", "status"],
+    )
+else:
+    HTTP_REQ_COUNTER = None
+
+if Histogram:
+    HTTP_REQ_LATENCY = Histogram(
+        "http_request_duration_seconds",
+        "HTTP request latency in seconds",
+        ["endpoint"],
+        # A handful of cutoffs instead of the 15 defaults: fewer bucket
+        # updates per observe() and a smaller scrape
+        buckets=(0.01, 0.05, 0.2, 1.0, 5.0),
+    )
+else:
+    HTTP_REQ_LATENCY = None
+
+
+def render_metrics():
+    """
+    Return (body, content_type) for the /metrics endpoint.
+    Under gunicorn every worker writes to PROMETHEUS_MULTIPROC_DIR, so the
+    files are aggregated per scrape; otherwise the default registry is used.
+    """
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST,
+        REGISTRY,
+        CollectorRegistry,
+        generate_latest,
+        multiprocess,
+    )
+
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
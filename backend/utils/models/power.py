@@ -51,6 +51,10 @@ class Power(object):
     def find(self, power_data, sort=None, limit=0):  # find all
         return self.db.find(power_data, self.collection_name, sort=sort, limit=limit)
 
+    def ensure_indexes(self):
+        # Every power query filters on site + a created range
+        return self.db.create_index(self.collection_name, [("site", 1), ("created", 1)])
+
     def find_by_id(self, id):
         return self.db.find_by_id(id, self.collection_name)
 
@@ -36,8 +36,10 @@ class Systems(object):
         res = self.db.insert(data, self.collection_name)
         return "Inserted Id " + res
 
-    def find(self, data, sort=None, limit=0):
-        return self.db.find(data, self.collection_name, sort=sort, limit=limit)
+    def find(self, data, sort=None, limit=0, projection=None):
+        return self.db.find(
+            data, self.collection_name, projection=projection, sort=sort, limit=limit
+        )
 
     def find_by_id(self, id):
         return self.db.find_by_id(id, self.collection_name)
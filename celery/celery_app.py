@@ -47,27 +47,54 @@ app.conf.update(
 )
 # ============================================================================
 
-# Updated beat schedule with more frequent system temperature checks
+# Updated beat schedule with more frequent system temperature checks.
+# Each run expires after one interval: if the workers are still busy with
+# a slow run, the queued duplicate is dropped instead of piling up behind it.
+POWER_INTERVAL = timedelta(minutes=10)
+TEMPERATURE_INTERVAL = timedelta(minutes=10)
+SYSTEM_TEMPERATURE_INTERVAL = timedelta(minutes=10)  # Changed from 5 minutes to 10 minutes
+FAN_SPEED_INTERVAL = timedelta(minutes=15)  # Run every 15 minutes to reduce the amount of data
+CONDUCTOR_SYNC_INTERVAL = timedelta(minutes=30)
+CRITICAL_POLL_INTERVAL = timedelta(seconds=10)  # Cheap tick; only systems due in the Redis schedule are polled
+SDR_CACHE_REFRESH_INTERVAL = timedelta(hours=1)  # Only BMCs with a missing or week-old cache are dumped
+
 app.conf.beat_schedule = {
     "fetch_power": {
         "task": "tasks.cron.fetch_power_data",
-        "schedule": timedelta(minutes=10),
+        "schedule": POWER_INTERVAL,
+        "options": {"expires": POWER_INTERVAL.total_seconds()},
     },
     "fetch_temperature": {
         "task": "tasks.cron.fetch_temperature_data",
-        "schedule": timedelta(minutes=10),
+        "schedule": TEMPERATURE_INTERVAL,
+        "options": {"expires": TEMPERATURE_INTERVAL.total_seconds()},
     },
     # The task itself will determine which systems to check based on their status
     "fetch_system_temperature": {
         "task": "tasks.cron.fetch_system_temperature_data",
-        "schedule": timedelta(minutes=10),  # Changed from 5 minutes to 10 minutes
+        "schedule": SYSTEM_TEMPERATURE_INTERVAL,
+        "options": {"expires": SYSTEM_TEMPERATURE_INTERVAL.total_seconds()},
+    },
+    # Systems at or above the critical threshold are re-polled every 30 seconds
+    "poll_critical_systems": {
+        "task": "tasks.cron.poll_critical_systems",
+        "schedule": CRITICAL_POLL_INTERVAL,
+        "options": {"expires": CRITICAL_POLL_INTERVAL.total_seconds()},
     },
     "fetch_system_fan_speed": {
         "task": "tasks.cron.fetch_system_fan_speed_data",
-        "schedule": timedelta(minutes=15),  # Run every 15 minutes to reduce the amount of data
+        "schedule": FAN_SPEED_INTERVAL,
+        "options": {"expires": FAN_SPEED_INTERVAL.total_seconds()},
+    },
+    # ipmitool SDR caches read by the fan speed poll
+    "refresh_ipmi_sdr_caches": {
+        "task": "tasks.cron.refresh_ipmi_sdr_caches",
+        "schedule": SDR_CACHE_REFRESH_INTERVAL,
+        "options": {"expires": SDR_CACHE_REFRESH_INTERVAL.total_seconds()},
     },
     "sync_conductor_systems": {
-    "task": "tasks.cron.sync_conductor_systems",
-    "schedule": timedelta(minutes=30),
+        "task": "tasks.cron.sync_conductor_systems",
+        "schedule": CONDUCTOR_SYNC_INTERVAL,
+        "options": {"expires": CONDUCTOR_SYNC_INTERVAL.total_seconds()},
     },
-}
\ No newline at end of file
+}
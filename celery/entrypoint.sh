@@ -18,7 +18,10 @@ echo "Metrics directory: $PROMETHEUS_MULTIPROC_DIR"
 echo "Preparing Prometheus multiprocess directory..."
 mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
 
-# Count and remove stale metric files
+# Count and remove stale metric files. prometheus_client still writes
+# per-process files here while PROMETHEUS_MULTIPROC_DIR is set, but the
+# worker gauges go through Redis and nothing reads these files, so each
+# container simply starts with an empty directory.
 STALE_COUNT=$(find "$PROMETHEUS_MULTIPROC_DIR" -name "*.db" 2>/dev/null | wc -l)
 if [ "$STALE_COUNT" -gt 0 ]; then
     echo "Removing $STALE_COUNT stale metric file(s)"
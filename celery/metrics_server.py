@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
 """
-Prometheus metrics aggregation server for Celery multiprocess workers.
-Reads metrics from all worker processes and exposes them on a single HTTP endpoint.
+Prometheus metrics server for the Celery workers.
+Serves the gauges the workers publish to Redis on a single HTTP endpoint.
 """
 import os
 import time
 import logging
-from prometheus_client import CollectorRegistry, multiprocess, generate_latest
+import threading
+from prometheus_client import CollectorRegistry, generate_latest, CONTENT_TYPE_LATEST
+from concurrent.futures import ThreadPoolExecutor
 from wsgiref.simple_server import make_server, WSGIServer
-from socketserver import ThreadingMixIn
+from utils.metrics import RedisGaugeCollector
 
 # Configure logging
 logging.basicConfig(
@@ -18,45 +20,115 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-class ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
-    """Threaded WSGI server to handle multiple concurrent scrapes."""
-    daemon_threads = True
+# Scrapes within this many seconds of the last one get the cached payload
+METRICS_CACHE_TTL = float(os.environ.get('METRICS_CACHE_TTL', 2))
+
+# A scrape is one pipelined HGETALL per gauge; warn if Redis is slow enough
+# that scrapes are about to time out
+METRICS_SLOW_SECONDS = float(os.environ.get('METRICS_SLOW_SECONDS', 3))
+
+registry = CollectorRegistry()
+registry.register(RedisGaugeCollector())
+
+# (timestamp, body, content_length), swapped as one tuple so a reader
+# never pairs a new body with an old length
+_metrics_cache = {"entry": (0.0, b"", "0")}
+_metrics_cache_lock = threading.Lock()
+
+class PooledWSGIServer(WSGIServer):
+    """WSGI server that handles scrapes on a fixed pool of threads
+    instead of spawning a new thread per connection."""
+    max_workers = int(os.environ.get('METRICS_SERVER_THREADS', 4))
+    
+    def server_activate(self):
+        super().server_activate()
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix='metrics-http'
+        )
+    
+    def process_request(self, request, client_address):
+        self._pool.submit(self._process_request_in_pool, request, client_address)
+    
+    def _process_request_in_pool(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+    
+    def server_close(self):
+        super().server_close()
+        self._pool.shutdown(wait=False)
+
+def _fresh_cache_entry():
+    entry = _metrics_cache["entry"]
+    if time.monotonic() - entry[0] < METRICS_CACHE_TTL:
+        return entry
+    return None
+
+def get_metrics_payload():
+    """
+    Return (body, content_length) for /metrics, re-reading Redis at most
+    once per METRICS_CACHE_TTL seconds. Only one thread collects at a
+    time; concurrent scrapes wait and reuse its bytes.
+    """
+    entry = _fresh_cache_entry()
+    if entry:
+        return entry[1], entry[2]
+    
+    requested_at = time.monotonic()
+    with _metrics_cache_lock:
+        # Single flight: if another scrape finished aggregating while we
+        # waited for the lock, share its result (even with the TTL at 0)
+        entry = _metrics_cache["entry"]
+        if entry[0] >= requested_at or _fresh_cache_entry():
+            return entry[1], entry[2]
+        
+        start_time = time.monotonic()
+        
+        logger.debug("Starting metrics collection")
+        data = generate_latest(registry)
+        duration = time.monotonic() - start_time
+        
+        logger.info("Metrics generated: %d bytes in %.3fs", len(data), duration)
+        if duration > METRICS_SLOW_SECONDS:
+            logger.warning("Slow metrics collection from Redis (%.1fs)", duration)
+        
+        content_length = str(len(data))
+        _metrics_cache["entry"] = (time.monotonic(), data, content_length)
+        return data, content_length
+
+HEALTH_PATHS = frozenset(('/health', '/healthz'))
+HEALTH_HEADERS = [('Content-Type', 'text/plain'), ('Content-Length', '7')]
+HEALTH_BODY = (b'healthy',)
 
 def metrics_app(environ, start_response):
     """WSGI application that serves Prometheus metrics and health check."""
     path = environ.get('PATH_INFO', '/')
     
     # Health check endpoint
-    if path in ['/health', '/healthz']:
-        logger.debug("Health check requested")
-        status = '200 OK'
-        headers = [('Content-Type', 'text/plain')]
-        start_response(status, headers)
-        return [b'healthy']
+    if path in HEALTH_PATHS:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Health check requested")
+        start_response('200 OK', list(HEALTH_HEADERS))
+        return HEALTH_BODY
     
     # Metrics endpoint
     try:
-        start_time = time.time()
-        
-        logger.debug("Starting metrics aggregation")
-        registry = CollectorRegistry()
-        multiprocess.MultiProcessCollector(registry)
-        
-        data = generate_latest(registry)
-        duration = time.time() - start_time
-        
-        logger.info(f"Metrics generated: {len(data)} bytes in {duration:.3f}s")
+        data, content_length = get_metrics_payload()
         
         status = '200 OK'
         headers = [
-            ('Content-Type', 'text/plain; version=0.0.4; charset=utf-8'),
-            ('Content-Length', str(len(data)))
+            ('Content-Type', CONTENT_TYPE_LATEST),
+            ('Content-Length', content_length)
         ]
         start_response(status, headers)
         return [data]
     
     except Exception as e:
-        logger.error(f"Error generating metrics: {e}", exc_info=True)
+        logger.error("Error generating metrics: %s", e, exc_info=True)
         status = '500 Internal Server Error'
         headers = [('Content-Type', 'text/plain')]
         start_response(status, headers)
@@ -65,37 +137,21 @@ def metrics_app(environ, start_response):
 def run_metrics_server():
     """Run the metrics server."""
     port = int(os.environ.get('WORKER_METRICS_PORT', 9200))
-    metrics_dir = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
     
     logger.info("=" * 60)
-    logger.info("Starting Prometheus Metrics Aggregation Server")
+    logger.info("Starting Prometheus Metrics Server")
     logger.info("=" * 60)
-    logger.info(f"Port: {port}")
-    logger.info(f"Metrics directory: {metrics_dir}")
-    
-    # Verify metrics directory exists
-    if not metrics_dir:
-        logger.error("PROMETHEUS_MULTIPROC_DIR not set!")
-        return
-    
-    if not os.path.exists(metrics_dir):
-        logger.warning(f"Metrics directory does not exist: {metrics_dir}")
-        logger.info("Waiting for workers to create metrics files...")
-    else:
-        # Count existing metric files
-        try:
-            db_files = [f for f in os.listdir(metrics_dir) if f.endswith('.db')]
-            logger.info(f"Found {len(db_files)} existing metric files")
-        except Exception as e:
-            logger.warning(f"Could not list metrics directory: {e}")
+    logger.info("Port: %s", port)
+    logger.info("Redis: %s:%s", os.environ.get('REDIS_HOST') or 'localhost', os.environ.get('REDIS_PORT') or 6379)
+    logger.info("Worker threads: %d", PooledWSGIServer.max_workers)
     
-    logger.info(f"Endpoints available:")
-    logger.info(f"  - Metrics: http://0.0.0.0:{port}/metrics")
-    logger.info(f"  - Health:  http://0.0.0.0:{port}/health")
+    logger.info("Endpoints available:")
+    logger.info("  - Metrics: http://0.0.0.0:%s/metrics", port)
+    logger.info("  - Health:  http://0.0.0.0:%s/health", port)
     logger.info("=" * 60)
     
-    server = make_server('0.0.0.0', port, metrics_app, ThreadingWSGIServer)
-    logger.info(f"Server ready to accept connections")
+    server = make_server('0.0.0.0', port, metrics_app, PooledWSGIServer)
+    logger.info("Server ready to accept connections")
     
     try:
         server.serve_forever()
@@ -12,20 +12,33 @@ Systems with temperatures >= 80°C are checked every 30 seconds instead of every
 
 import os
 import json
+import base64
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 import redis
+import redis.asyncio as aioredis
 import asyncio
 import subprocess
 import re
+import socket
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import paramiko
+import threading
 import time
+import uuid
+import functools
 from datetime import datetime, timedelta
 from celery import shared_task
+from celery.signals import task_postrun, worker_process_init, worker_process_shutdown
 from utils.models.pdu import PDU
 from utils.models.power import Power
 from utils.models.temperature import Temperature
 from utils.models.systems import Systems
-from utils.metrics import SYSTEM_GPU_TEMP_GAUGE, POWER_GAUGE, TEMP_GAUGE, SYSTEM_FAN_SPEED
+from utils.metrics import SYSTEM_GPU_TEMP_GAUGE, POWER_GAUGE, TEMP_GAUGE, SYSTEM_FAN_SPEED, flush_gauges
 from puresnmp import Client, V2C, ObjectIdentifier as OID
 from dotenv import load_dotenv
 import urllib3
@@ -38,11 +51,87 @@ from ats_models.pydantic.conductor_query import ConductorQuery
 from utils.models.conductor_systems import ConductorSystems
 
 
-EXECUTOR = ThreadPoolExecutor(max_workers=20)  # Adjust based on needs
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+
+def _json_default(obj):
+    # datetimes become ISO strings, matching what orjson does natively
+    return obj.isoformat() if hasattr(obj, "isoformat") else str(obj)
+
+
+def _json_dumps(obj):
+    """Serialize Redis payloads in C when orjson is available (returns bytes)."""
+    if orjson:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, default=_json_default)
+
+
+def _json_loads(data):
+    """Parse str or raw bytes (Redis values, Redfish response bodies)."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+logger = logging.getLogger(__name__)
+_LOG_LISTENER = None
+
+
+@worker_process_init.connect
+def _start_log_listener(**kwargs):
+    """
+    Route this module's log records through a queue in each pool process so
+    the handlers' stream writes happen on a listener thread, not on the
+    temperature sweep's event loop. QueueHandler.prepare() still formats
+    the message in the emitting thread; only the I/O moves off the loop.
+    Started after the fork because threads do not survive it; the solo pool
+    keeps plain propagation.
+    """
+    global _LOG_LISTENER
+    if _LOG_LISTENER is not None:
+        return
+    log_queue = queue.SimpleQueue()
+    _LOG_LISTENER = QueueListener(log_queue, *logging.getLogger().handlers, respect_handler_level=True)
+    _LOG_LISTENER.start()
+    atexit.register(_LOG_LISTENER.stop)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.propagate = False
+
 
 # Disable SSL warnings for self-signed certificates
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Shared Redfish session: keeps BMC connections alive across GPU sensor reads
+# (Quanta needs 8 requests per system) and across polls in this worker.
+# Transport-level failures (connect errors, read timeouts, 502/503/504) get
+# one retry here on the pooled connection, honouring Retry-After; the async
+# sweep has its own slower retry loop for readings that fail validation.
+REDFISH_TIMEOUT = (5, 15)         # (connect, read) seconds
+REDFISH_SENSOR_TIMEOUT = (5, 10)
+_SESSION = requests.Session()
+_SESSION.verify = False
+# pool_connections is the number of per-host pools kept (LRU): it must cover
+# the whole BMC fleet or hosts evict each other and every cycle re-handshakes.
+# pool_maxsize is per host; the Quanta/GT fan-out opens at most 8 at once.
+_REDFISH_ADAPTER = HTTPAdapter(
+    pool_connections=512,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=1,
+        connect=1,
+        read=1,
+        status=1,
+        status_forcelist=(502, 503, 504),
+        backoff_factor=0.5,
+        raise_on_status=False,  # hand the last response to the handler's status check
+    ),
+)
+_SESSION.mount("https://", _REDFISH_ADAPTER)
+_SESSION.mount("http://", _REDFISH_ADAPTER)  # GT BMCs serve Redfish on plain :8080
+atexit.register(_SESSION.close)
+
 # Import SystemTemperature model with error handling
 try:
     from utils.models.system_temperature import SystemTemperature
@@ -54,6 +143,24 @@ except ImportError as e:
 # Ensure .env file is loaded in tasks
 load_dotenv()
 
+REDIS_CONNECTION_KWARGS = {
+    "host": str(os.environ.get("REDIS_HOST") or "localhost"),
+    "port": int(os.environ.get("REDIS_PORT") or 6379),
+    "password": os.environ.get("REDIS_PASSWORD") or None,
+    "db": 0,
+    "decode_responses": True,
+    "socket_keepalive": True,
+    # PING a connection that sat idle this long before reusing it, so a
+    # socket dropped between 10 minute runs is replaced instead of erroring
+    "health_check_interval": 30,
+}
+
+# One connection pool per worker process (redis-py resets it after fork).
+# Every task and helper borrows from it instead of opening its own socket.
+_REDIS_POOL = redis.BlockingConnectionPool(max_connections=32, **REDIS_CONNECTION_KWARGS)
+# The client itself is stateless over the pool, so one instance serves all tasks
+_REDIS = redis.Redis(connection_pool=_REDIS_POOL)
+
 # ============================================================================
 # TEMPERATURE VALIDATION AND RETRY CONSTANTS
 # ============================================================================
@@ -61,7 +168,28 @@ MIN_VALID_TEMP = 20.0
 MAX_VALID_TEMP = 100.0
 MAX_RETRY_ATTEMPTS = 3
 MAX_CONCURRENT_SYSTEMS = 10  # Adjust based on network capacity
+MAX_CONCURRENT_SNMP = 50     # In-flight PDU SNMP gets on one event loop
 RETRY_DELAY_SECONDS = 5      # Reduced from 30 seconds
+SYSTEM_DEADLINE_SECONDS = 60 # Whole retry budget for one system in a sweep
+
+# Blocking BMC fetchers (Redfish via the shared session, Dell/Banff via SSH)
+# run here: EXECUTOR.map in fetch_system_temperature_data and
+# poll_critical_systems, and the (unscheduled) async sweep, whose semaphore
+# admits MAX_CONCURRENT_SYSTEMS systems at once.
+EXECUTOR = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_SYSTEMS, thread_name_prefix="bmc-fetch")
+# Per-GPU sensor GETs for Quanta/GT, fanned out from inside a fetcher thread.
+# Kept separate from EXECUTOR so a fetcher never waits on its own pool.
+REDFISH_SENSOR_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_SYSTEMS * 8, thread_name_prefix="redfish-sensor")
+
+# ============================================================================
+# ENVIRONMENT-DRIVEN SETTINGS (read once at import, after load_dotenv)
+# ============================================================================
+SNMP_COMMUNITY = os.environ.get("SNMP_COMMUNITY") or "amd123"
+FAN_SPEED_MAX_WORKERS = int(os.environ.get("FAN_SPEED_MAX_WORKERS", "10"))
+FAN_SPEED_BATCH_SIZE = int(os.environ.get("FAN_SPEED_BATCH_SIZE", "33"))
+IPMI_SDR_CACHE_DIR = os.environ.get("IPMI_SDR_CACHE_DIR") or "/var/tmp"
+IPMI_SDR_CACHE_MAX_AGE = 7 * 24 * 60 * 60  # re-dump each BMC's SDR weekly
+IPMI_SDR_DUMP_TIMEOUT = 120
 
 # ============================================================================
 # CRITICAL TEMPERATURE MONITORING CONSTANTS
@@ -70,9 +198,68 @@ CRITICAL_TEMP_THRESHOLD = 80.0
 CRITICAL_CHECK_INTERVAL = 30  # seconds
 NORMAL_CHECK_INTERVAL = 300   # 5 minutes in seconds
 
+# Only these fields are read from the systems collection by the polling tasks;
+# projecting keeps unrelated system metadata off the wire every cycle.
+SYSTEM_NAME_PROJECTION = {"_id": 0, "system": 1}
+SYSTEM_CREDENTIAL_PROJECTION = {"_id": 0, "system": 1, "bmc_ip": 1, "username": 1, "password": 1}
+# Credentials change only when a system is edited, so each worker process
+# re-reads them at most this often; mostly saves the 10s critical poll a query
+BMC_CREDENTIALS_CACHE_SECONDS = 300
+
 # Redis keys for tracking critical systems
-CRITICAL_SYSTEMS_KEY = "critical_temp_systems"
+# Hash of system name -> JSON {max_temp, timestamp (unix seconds), check_count}; systems are
+# added and removed one field at a time, never by rewriting the whole set.
+CRITICAL_SYSTEMS_KEY = "critical_temp_systems_hash"
 LAST_CHECK_TIME_KEY = "system_temp_last_check"
+# Sorted set of critical system names scored by the unix time of their next
+# poll; poll_critical_systems only ever touches the entries that are due.
+CRITICAL_POLL_KEY = "critical_temp_poll"
+# Hash of system name -> consecutive failed critical re-polls. A hot system
+# whose BMC stops answering is dropped from CRITICAL_POLL_KEY after
+# CRITICAL_POLL_MAX_FAILURES misses; the regular sweep re-adds it if a later
+# reading is still critical.
+CRITICAL_POLL_FAILURES_KEY = "critical_temp_poll_failures"
+CRITICAL_POLL_MAX_FAILURES = 5
+
+
+# Banff rack-manager SDR parsing: rack id is the trailing number of the
+# system name, temps look like "GPU_3_DIE_TEMP | 45 degrees C | ok"
+RACK_ID_RE = re.compile(r'(\d+)$')
+BANFF_GPU_TEMP_RE = re.compile(r'GPU_([0-7])_DIE_TEMP\b.*?(\d+(?:\.\d+)?)\s*degrees?\s*C', re.IGNORECASE)
+
+# System name prefix -> vendor type; none of the prefixes overlap, so one
+# anchored alternation replaces the startswith() chain
+SYSTEM_TYPE_RE = re.compile(r'(smci|miramar|gbt|quanta|banff|dell|gt)', re.IGNORECASE)
+
+# Dell root-shell script output: one "GPU<n>TEMP:<celsius>" line per GPU.
+# Anchored at line start so the pty's echo of the script itself never matches.
+DELL_GPU_TEMP_RE = re.compile(r'^GPU([0-7])TEMP:\s*(\d+(?:\.\d+)?)', re.MULTILINE)
+DELL_SSH_TIMEOUT = 30
+
+# ipmitool SDR fan rows, e.g. "Fan_SYS1_1 | 9600 RPM | ok"; a trailing " RPM"
+# on the sensor name is dropped and rows without a numeric reading never match
+IPMI_FAN_RPM_RE = re.compile(r'^[ \t]*([^|\n]+?)(?:[ \t]+RPM)?[ \t]*\|[ \t]*(\d+)[ \t]+RPM\b', re.MULTILINE)
+
+
+def _build_dell_gpu_temp_script():
+    """
+    Root-shell script that reads all 8 OAM ThermalMetrics in parallel from
+    the iDRAC's internal Redfish endpoint and prints one marker line per GPU.
+    """
+    curl_jobs = []
+    for gpu_num in range(8):
+        marker = f"GPU{gpu_num}TEMP"
+        curl_jobs.append(
+            f"(curl -s http://192.168.31.1/redfish/v1/Chassis/OAM_{gpu_num}/"
+            f"ThermalSubsystem/ThermalMetrics 2>/dev/null | "
+            f"awk '/GPU_{gpu_num}_DIE_TEMP/{{f=1}} f && /ReadingCelsius/"
+            f"{{print \"{marker}:\" $2; exit}}') &"
+        )
+    return " ".join(curl_jobs) + " wait; exit\n"
+
+
+# Identical for every Dell system, so built once at import
+DELL_GPU_TEMP_SCRIPT = _build_dell_gpu_temp_script()
 
 
 CONDUCTOR_MATCH_TERM = "odcdh"
@@ -317,40 +504,41 @@ def sync_conductor_systems():
 
 
 def get_redis_lock_client():
-    """Get Redis client for task locking"""
-    try:
-        redis_host = str(os.environ.get("REDIS_HOST") or "localhost")
-        redis_port = int(os.environ.get("REDIS_PORT") or 6379)
-        redis_password = str(os.environ.get("REDIS_PASSWORD") or "")
-        
-        return redis.Redis(
-            host=redis_host,
-            port=redis_port,
-            password=redis_password if redis_password else None,
-            db=0,
-            decode_responses=True
-        )
-    except Exception as e:
-        print(f"Error creating Redis client: {e}")
-        return None
+    """Get Redis client for task locking (the shared module client)"""
+    return _REDIS
+
+
+# Delete the lock only if it still holds our token, so a run that outlived
+# its TTL cannot release a lock another worker has since acquired
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def acquire_task_lock(redis_client, lock_key, ttl):
+    """Try to take lock_key for ttl seconds. Returns the owner token, or None if held."""
+    token = uuid.uuid4().hex
+    return token if redis_client.set(lock_key, token, nx=True, ex=ttl) else None
+
+
+def release_task_lock(redis_client, lock_key, token):
+    """Release lock_key if token still owns it. Returns True if it was deleted."""
+    return bool(redis_client.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token))
+
+def get_async_redis_client():
+    """
+    Get an asyncio Redis client for use inside one event loop.
+    Its connections belong to the loop that first uses them, so create it
+    inside the coroutine and aclose() it before the loop ends.
+    """
+    return aioredis.Redis(**REDIS_CONNECTION_KWARGS)
 
 def get_redis_client():
-    """Get Redis client for tracking critical systems"""
-    try:
-        redis_host = str(os.environ.get("REDIS_HOST") or "localhost")
-        redis_port = int(os.environ.get("REDIS_PORT") or 6379)
-        redis_password = str(os.environ.get("REDIS_PASSWORD") or "")
-        
-        return redis.Redis(
-            host=redis_host,
-            port=redis_port,
-            password=redis_password if redis_password else None,
-            db=0,
-            decode_responses=True
-        )
-    except Exception as e:
-        print(f"Error creating Redis client: {e}")
-        return None
+    """Get Redis client for tracking critical systems (the shared module client)"""
+    return _REDIS
 
 
 def is_critical_temperature(gpu_temps):
@@ -366,69 +554,156 @@ def is_critical_temperature(gpu_temps):
     if not gpu_temps or not isinstance(gpu_temps, list):
         return False, None, []
     
-    valid_temps = [t for t in gpu_temps if t is not None]
+    # Single pass for the max reading and the GPUs over the threshold
+    max_temp = None
+    critical_gpus = []
+    for i, t in enumerate(gpu_temps):
+        if t is None:
+            continue
+        if max_temp is None or t > max_temp:
+            max_temp = t
+        if t >= CRITICAL_TEMP_THRESHOLD:
+            critical_gpus.append(i)
     
-    if not valid_temps:
+    if max_temp is None:
         return False, None, []
     
-    max_temp = max(valid_temps)
-    critical_gpus = [i for i, t in enumerate(gpu_temps) if t is not None and t >= CRITICAL_TEMP_THRESHOLD]
-    
-    is_critical = max_temp >= CRITICAL_TEMP_THRESHOLD
-    
-    return is_critical, max_temp, critical_gpus
+    return bool(critical_gpus), max_temp, critical_gpus
 
 
-def update_critical_systems_list(system_name, is_critical, max_temp, redis_client):
+def apply_critical_update(critical_systems, system_name, is_critical, max_temp, checked_at):
     """
-    Update the Redis set of systems with critical temperatures.
+    Add, refresh or drop one system in an in-memory critical systems dict.
     
     Args:
+        critical_systems: Dict loaded from CRITICAL_SYSTEMS_KEY (mutated in place)
         system_name: Name of the system
         is_critical: Boolean indicating if system is at critical temp
         max_temp: Maximum temperature recorded
-        redis_client: Redis client instance
+        checked_at: Unix seconds shared by every update in the cycle
     """
-    if not redis_client:
+    if is_critical:
+        # Add or update system in critical list
+        critical_systems[system_name] = {
+            "max_temp": max_temp,
+            "timestamp": checked_at,
+            "check_count": critical_systems.get(system_name, {}).get("check_count", 0) + 1
+        }
+        logger.warning("🔥 CRITICAL ALERT: %s added to critical monitoring - Max temp: %s°C", system_name, max_temp)
+    else:
+        # Remove system from critical list if it exists
+        if system_name in critical_systems:
+            removed_data = critical_systems.pop(system_name)
+            logger.info("✅ RECOVERY: %s removed from critical monitoring - Was: %s°C, Now below %s°C",
+                        system_name, removed_data["max_temp"], CRITICAL_TEMP_THRESHOLD)
+
+
+async def flush_system_check_updates(check_updates, critical_systems, redis_client):
+    """
+    Write the results of one monitoring cycle back to Redis in a single round trip.
+    
+    Each checked system's critical hash field is set or deleted, and its
+    last-check time written, through one non-transactional pipeline.
+    
+    Args:
+        check_updates: List of (system_name, is_critical, max_temp) tuples
+        critical_systems: The cycle's critical systems snapshot (mutated in place)
+        redis_client: asyncio Redis client instance
+    """
+    if not redis_client or not check_updates:
         return
     
     try:
-        critical_systems_data = redis_client.get(CRITICAL_SYSTEMS_KEY)
-        critical_systems = json.loads(critical_systems_data) if critical_systems_data else {}
+        checked_at = int(time.time())
         
-        if is_critical:
-            # Add or update system in critical list
-            critical_systems[system_name] = {
-                "max_temp": max_temp,
-                "timestamp": datetime.now().isoformat(),
-                "check_count": critical_systems.get(system_name, {}).get("check_count", 0) + 1
-            }
-            print(f"🔥 CRITICAL ALERT: {system_name} added to critical monitoring - Max temp: {max_temp}°C")
-        else:
-            # Remove system from critical list if it exists
-            if system_name in critical_systems:
-                removed_data = critical_systems.pop(system_name)
-                print(f"✅ RECOVERY: {system_name} removed from critical monitoring - Was: {removed_data['max_temp']}°C, Now below {CRITICAL_TEMP_THRESHOLD}°C")
-        
-        # Save updated list
-        redis_client.setex(
-            CRITICAL_SYSTEMS_KEY,
-            86400,  # 24 hour TTL
-            json.dumps(critical_systems)
-        )
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for system_name, is_critical, max_temp in check_updates:
+                apply_critical_update(critical_systems, system_name, is_critical, max_temp, checked_at)
+                if is_critical:
+                    pipe.hset(CRITICAL_SYSTEMS_KEY, system_name, _json_dumps(critical_systems[system_name]))
+                else:
+                    # HDEL of a missing field is a no-op, so also safe if the snapshot read failed
+                    pipe.hdel(CRITICAL_SYSTEMS_KEY, system_name)
+                pipe.setex(f"{LAST_CHECK_TIME_KEY}:{system_name}", 86400, checked_at)
+            
+            # Refresh the 24 hour TTL on the hash
+            pipe.expire(CRITICAL_SYSTEMS_KEY, 86400)
+            await pipe.execute()
         
         # Log current critical systems count
         if critical_systems:
-            print(f"⚠️  Currently monitoring {len(critical_systems)} critical system(s): {list(critical_systems.keys())}")
+            logger.info("⚠️  Currently monitoring %d critical system(s): %s", len(critical_systems), list(critical_systems))
         
     except Exception as e:
-        print(f"Error updating critical systems list: {e}")
+        logger.error("Error updating critical systems list: %s", e)
+
+
+def update_critical_poll_schedule(results, redis_client):
+    """
+    Keep CRITICAL_POLL_KEY in step with the latest readings.
+    
+    Args:
+        results: List of (system_name, is_critical) tuples
+        redis_client: Redis client instance
+    """
+    if not redis_client or not results:
+        return
+    
+    try:
+        next_due = time.time() + CRITICAL_CHECK_INTERVAL
+        critical = {name: next_due for name, is_critical in results if is_critical}
+        recovered = [name for name, is_critical in results if not is_critical]
+        
+        with redis_client.pipeline(transaction=False) as pipe:
+            if critical:
+                pipe.zadd(CRITICAL_POLL_KEY, critical)
+            if recovered:
+                pipe.zrem(CRITICAL_POLL_KEY, *recovered)
+            # A reading came back, so any run of failed re-polls is over
+            pipe.hdel(CRITICAL_POLL_FAILURES_KEY, *(name for name, _ in results))
+            pipe.execute()
+    except Exception as e:
+        logger.error("Error updating critical poll schedule: %s", e)
 
 
-def get_critical_systems(redis_client):
+def record_critical_poll_failures(failed, redis_client):
+    """
+    Count a failed critical re-poll for each system in failed and stop
+    re-polling the ones that reached CRITICAL_POLL_MAX_FAILURES in a row.
+    
+    Returns:
+        list: Systems that should stay on the critical schedule
+    """
+    if not failed:
+        return []
+    
+    try:
+        with redis_client.pipeline(transaction=False) as pipe:
+            for name in failed:
+                pipe.hincrby(CRITICAL_POLL_FAILURES_KEY, name, 1)
+            counts = pipe.execute()
+        
+        exhausted = [name for name, count in zip(failed, counts) if count >= CRITICAL_POLL_MAX_FAILURES]
+        if exhausted:
+            logger.warning("Dropping %d unreachable system(s) from critical polling after %d failures: %s",
+                           len(exhausted), CRITICAL_POLL_MAX_FAILURES, exhausted)
+            with redis_client.pipeline(transaction=False) as pipe:
+                pipe.zrem(CRITICAL_POLL_KEY, *exhausted)
+                pipe.hdel(CRITICAL_POLL_FAILURES_KEY, *exhausted)
+                pipe.execute()
+        return [name for name in failed if name not in exhausted]
+    except Exception as e:
+        logger.error("Error recording critical poll failures: %s", e)
+        return list(failed)
+
+
+async def get_critical_systems(redis_client):
     """
     Get list of systems currently at critical temperatures.
     
+    Args:
+        redis_client: asyncio Redis client instance
+    
     Returns:
         dict: Dictionary of critical systems with their data
     """
@@ -436,42 +711,59 @@ def get_critical_systems(redis_client):
         return {}
     
     try:
-        critical_systems_data = redis_client.get(CRITICAL_SYSTEMS_KEY)
-        return json.loads(critical_systems_data) if critical_systems_data else {}
+        critical_systems_data = await redis_client.hgetall(CRITICAL_SYSTEMS_KEY)
+        return {name: _json_loads(data) for name, data in critical_systems_data.items()}
     except Exception as e:
-        print(f"Error getting critical systems: {e}")
+        logger.error("Error getting critical systems: %s", e)
         return {}
 
 
-def should_check_system_now(system_name, redis_client):
+async def load_last_check_times(system_names, redis_client):
+    """
+    Read every system's last check time with a single MGET.
+    
+    Returns:
+        dict: {system_name: unix time string or None}, or None if Redis is unavailable
+    """
+    if not redis_client:
+        return None
+    
+    try:
+        keys = [f"{LAST_CHECK_TIME_KEY}:{name}" for name in system_names]
+        values = await redis_client.mget(keys) if keys else []
+        return dict(zip(system_names, values))
+    except Exception as e:
+        logger.error("Error loading last check times: %s", e)
+        return None
+
+
+def should_check_system_now(system_name, last_checks, critical_systems, now):
     """
     Determine if a system should be checked now based on its critical status.
+    Pure in-memory decision; the caller preloads the Redis state once per cycle.
     
     Args:
         system_name: Name of the system
-        redis_client: Redis client instance
+        last_checks: Dict from load_last_check_times (None if Redis unavailable)
+        critical_systems: Dict from get_critical_systems
+        now: Unix seconds for the cycle, read once by the caller
     
     Returns:
         tuple: (should_check: bool, reason: str)
     """
-    if not redis_client:
+    if last_checks is None:
         return True, "Redis unavailable, checking all systems"
     
     try:
-        # Get critical systems list
-        critical_systems = get_critical_systems(redis_client)
-        
-        # Get last check time for this system
-        last_check_key = f"{LAST_CHECK_TIME_KEY}:{system_name}"
-        last_check_time_str = redis_client.get(last_check_key)
+        last_check_time = last_checks.get(system_name)
         
         is_critical = system_name in critical_systems
         
-        if not last_check_time_str:
+        if not last_check_time:
             return True, "First check"
         
-        last_check_time = datetime.fromisoformat(last_check_time_str)
-        time_since_check = (datetime.now() - last_check_time).total_seconds()
+        # Stored as integer unix seconds, so no datetime parsing per system
+        time_since_check = now - int(last_check_time)
         
         if is_critical:
             # Check every 30 seconds for critical systems
@@ -487,25 +779,10 @@ def should_check_system_now(system_name, redis_client):
                 return False, f"Normal system checked recently ({int(time_since_check)}s ago)"
         
     except Exception as e:
-        print(f"Error in should_check_system_now: {e}")
+        logger.error("Error in should_check_system_now: %s", e)
         return True, "Error checking status, defaulting to check"
 
 
-def record_system_check_time(system_name, redis_client):
-    """Record the time a system was checked."""
-    if not redis_client:
-        return
-    
-    try:
-        last_check_key = f"{LAST_CHECK_TIME_KEY}:{system_name}"
-        redis_client.setex(
-            last_check_key,
-            86400,  # 24 hour TTL
-            datetime.now().isoformat()
-        )
-    except Exception as e:
-        print(f"Error recording check time: {e}")
-
 def validate_gpu_temperatures(gpu_temps):
     """
     Validate GPU temperature array.
@@ -527,106 +804,88 @@ def validate_gpu_temperatures(gpu_temps):
     if len(valid_temps) == 0:
         return False, "All GPU temperatures are None"
     
-    # Check if any temperature is outside valid range
-    invalid_temps = [t for t in valid_temps if t < MIN_VALID_TEMP or t > MAX_VALID_TEMP]
-    
-    if invalid_temps:
-        return False, f"Temperature(s) outside valid range ({MIN_VALID_TEMP}-{MAX_VALID_TEMP}°C): {invalid_temps}"
+    # Common case: min()/max() run in C, no per-value Python comparisons
+    if MIN_VALID_TEMP <= min(valid_temps) and max(valid_temps) <= MAX_VALID_TEMP:
+        return True, "Valid"
     
-    return True, "Valid"
+    # Only build the list of offenders when something is out of range
+    invalid_temps = [t for t in valid_temps if not MIN_VALID_TEMP <= t <= MAX_VALID_TEMP]
+    return False, f"Temperature(s) outside valid range ({MIN_VALID_TEMP}-{MAX_VALID_TEMP}°C): {invalid_temps}"
 
 
-async def fetch_gpu_temperatures_with_retry_async(system_name, bmc_ip, username, password, system_type):
+async def fetch_gpu_temperatures_with_retry_async(system_name, bmc_ip, username, password, system_type, in_flight=None):
     """
     NON-BLOCKING retry logic using asyncio.sleep
     
     OLD: time.sleep(30) - BLOCKED entire worker for 30 seconds per retry
     NEW: await asyncio.sleep(5) - Worker can process other systems while waiting
+
+    Each EXECUTOR future is appended to in_flight (if given) so a caller that
+    cancels this coroutine can still wait for the blocking fetch to return.
     """
     validation_messages = []
     
+    fetch = SSH_GPU_TEMP_FETCHERS.get(system_type)
+    if fetch is not None:
+        fetch_arg = system_name
+    else:
+        fetch, fetch_arg = fetch_gpu_temperatures_redfish, system_type
+    
     for attempt in range(1, MAX_RETRY_ATTEMPTS + 1):
-        print(f"[RETRY] Attempt {attempt}/{MAX_RETRY_ATTEMPTS} for {system_name}")
+        logger.debug("[RETRY] Attempt %d/%d for %s", attempt, MAX_RETRY_ATTEMPTS, system_name)
         
-        # Run blocking I/O in thread pool (non-blocking)
-        loop = asyncio.get_event_loop()
-        
-        if system_type == "banff":
-            gpu_temps = await loop.run_in_executor(
-                EXECUTOR,  
-                fetch_gpu_temperatures_banff_ssh, 
-                bmc_ip, username, password, system_name
-            )
-        elif system_type == "dell":
-            gpu_temps = await loop.run_in_executor(
-                EXECUTOR,
-                fetch_gpu_temperatures_dell_ssh,
-                bmc_ip, username, password, system_name
-            )
-        else:
-            gpu_temps = await loop.run_in_executor(
-                EXECUTOR,
-                fetch_gpu_temperatures_redfish,
-                bmc_ip, username, password, system_type
-            )
+        # Run blocking I/O in the bounded thread pool (non-blocking)
+        future = EXECUTOR.submit(fetch, bmc_ip, username, password, fetch_arg)
+        if in_flight is not None:
+            in_flight.append(future)
+        gpu_temps = await asyncio.wrap_future(future)
         
         is_valid, reason = validate_gpu_temperatures(gpu_temps)
         
         validation_msg = f"Attempt {attempt}: {reason}"
         validation_messages.append(validation_msg)
-        print(f"[RETRY] {system_name} - {validation_msg}")
+        logger.debug("[RETRY] %s - %s", system_name, validation_msg)
         
         if is_valid:
-            print(f"[RETRY] {system_name} - Valid on attempt {attempt}")
+            logger.debug("[RETRY] %s - Valid on attempt %d", system_name, attempt)
             return gpu_temps, attempt, validation_messages
         
         # NON-BLOCKING wait (was time.sleep)
         if attempt < MAX_RETRY_ATTEMPTS:
-            print(f"[RETRY] {system_name} - Waiting {RETRY_DELAY_SECONDS}s (NON-BLOCKING)...")
+            logger.debug("[RETRY] %s - Waiting %ss (NON-BLOCKING)...", system_name, RETRY_DELAY_SECONDS)
             await asyncio.sleep(RETRY_DELAY_SECONDS)  
         else:
-            print(f"[RETRY] {system_name} - All attempts exhausted")
+            logger.warning("[RETRY] %s - All attempts exhausted", system_name)
     
     return gpu_temps, MAX_RETRY_ATTEMPTS, validation_messages
 
 
-async def process_single_system_async(system, bmc_credentials, redis_client, created_time):
+async def process_single_system_async(system_name, bmc_credentials, created_time, check_updates, in_flight=None):
     """
     Process one system asynchronously (non-blocking)
-    Returns temperature data dict or None
+    The caller has already decided the system is due and has credentials.
+    Returns temperature data dict or None; Redis bookkeeping for the system
+    is appended to check_updates and flushed once by the caller. in_flight
+    collects the EXECUTOR futures (see fetch_gpu_temperatures_with_retry_async).
     """
-    system_name = system.get("system")
-    if not system_name or system_name not in bmc_credentials:
-        return None
-    
-    should_check, reason = should_check_system_now(system_name, redis_client)
-    
-    if not should_check:
-        print(f"SKIPPING {system_name}: {reason}")
-        return None
-    
-    print(f"✓ CHECKING {system_name}: {reason}")
-    
     credentials = bmc_credentials[system_name]
     bmc_ip = credentials["bmc_ip"]
     username = credentials["username"]
     password = credentials["password"]
-    
-    system_type = determine_system_type(system_name)
+    system_type = credentials["system_type"]
     
     # Use async retry (non-blocking)
     gpu_temperatures, attempts_made, _ = await fetch_gpu_temperatures_with_retry_async(
-        system_name, bmc_ip, username, password, system_type
+        system_name, bmc_ip, username, password, system_type, in_flight
     )
     
     if gpu_temperatures is not None:
         is_critical, max_temp, critical_gpus = is_critical_temperature(gpu_temperatures)
         
-        if redis_client:
-            update_critical_systems_list(system_name, is_critical, max_temp, redis_client)
+        check_updates.append((system_name, is_critical, max_temp))
         
         if is_critical:
-            print(f"CRITICAL: {system_name} - {max_temp}°C")
+            logger.warning("CRITICAL: %s - %s°C", system_name, max_temp)
         
         temp_data = {
             "system": system_name,
@@ -637,15 +896,13 @@ async def process_single_system_async(system, bmc_credentials, redis_client, cre
             "updated": created_time,
         }
         
-        valid_temps = [t for t in gpu_temperatures if t is not None]
-        print(f"✓ {system_name}: {len(valid_temps)}/8 GPUs, {attempts_made} attempts")
-        
-        if redis_client:
-            record_system_check_time(system_name, redis_client)
+        if logger.isEnabledFor(logging.DEBUG):
+            valid_temps = [t for t in gpu_temperatures if t is not None]
+            logger.debug("✓ %s: %d/8 GPUs, %d attempts", system_name, len(valid_temps), attempts_made)
         
         return temp_data
     else:
-        print(f"✗ {system_name}: Failed after {attempts_made} attempts")
+        logger.warning("✗ %s: Failed after %d attempts", system_name, attempts_made)
         return None
 
 
@@ -655,103 +912,168 @@ async def fetch_system_temperature_data_async():
     
     OLD: Sequential processing - 100 systems × 30s = 50 minutes!
     NEW: Concurrent batches - 100 systems ÷ 10 concurrent × 10s = ~2 minutes!
+
+    NOT SCHEDULED: beat runs the sync fetch_system_temperature_data, and
+    nothing calls this coroutine. Unlike the sync task it neither records
+    the GPU temperature gauges nor feeds CRITICAL_POLL_KEY, so it cannot
+    replace it as is. Kept working (see tests/test_cron.py) but dormant.
     """
+    redis_client = get_async_redis_client()
+    critical_systems = {}
     try:
-        redis_client = get_redis_client()
-        
         if redis_client:
-            print("=" * 80)
-            print("NON-BLOCKING CONCURRENT TEMPERATURE MONITORING")
-            print("=" * 80)
-            critical_systems = get_critical_systems(redis_client)
-            if critical_systems:
-                print(f"{len(critical_systems)} critical system(s) monitored")
-            print(f"Max concurrent: {MAX_CONCURRENT_SYSTEMS} systems")
-            print("=" * 80)
+            critical_systems = await get_critical_systems(redis_client)
+            logger.info("NON-BLOCKING CONCURRENT TEMPERATURE MONITORING: %d critical system(s) monitored, max concurrent %d",
+                        len(critical_systems), MAX_CONCURRENT_SYSTEMS)
         
         bmc_credentials = parse_bmc_credentials()
         if not bmc_credentials:
-            print("No BMC credentials")
+            logger.warning("No BMC credentials")
             return
 
         if SystemTemperature is None:
-            print("SystemTemperature model unavailable")
+            logger.warning("SystemTemperature model unavailable")
             return
 
         systems_model = Systems()
-        all_systems = systems_model.find({})
-        print(f"Found {len(all_systems)} systems to check")
+        all_systems = systems_model.find({}, projection=SYSTEM_NAME_PROJECTION)
+        logger.info("Found %d systems to check", len(all_systems))
 
         if not all_systems:
             return
 
         created_time = datetime.now()
+        check_updates = []
         
-        # Create concurrent tasks for ALL systems
-        tasks = [
-            process_single_system_async(system, bmc_credentials, redis_client, created_time)
-            for system in all_systems
-        ]
+        # One MGET for every system's last check time instead of a GET per system
+        system_names = [system["system"] for system in all_systems if system.get("system")]
+        last_checks = await load_last_check_times(system_names, redis_client)
+        
+        # Decide who is due up front so skipped systems never become coroutines
+        now = int(time.time())
+        due_systems = []
+        for system_name in system_names:
+            if system_name not in bmc_credentials:
+                continue
+            should_check, reason = should_check_system_now(system_name, last_checks, critical_systems, now)
+            if not should_check:
+                logger.debug("SKIPPING %s: %s", system_name, reason)
+                continue
+            logger.debug("✓ CHECKING %s: %s", system_name, reason)
+            due_systems.append(system_name)
+        
+        if not due_systems:
+            logger.info("No systems due for a check this cycle")
+            return
         
         # Limit concurrency with semaphore (prevents overwhelming network)
         semaphore = asyncio.Semaphore(MAX_CONCURRENT_SYSTEMS)
         
-        async def bounded_task(task):
+        async def bounded_task(system_name):
+            in_flight = []
             async with semaphore:
-                return await task
-        
-        print(f"Processing {len(tasks)} systems with {MAX_CONCURRENT_SYSTEMS} concurrent workers...")
+                try:
+                    # A hung BMC stops retrying at the deadline instead of
+                    # holding the whole cycle open for every attempt
+                    return await asyncio.wait_for(
+                        process_single_system_async(system_name, bmc_credentials, created_time, check_updates, in_flight),
+                        timeout=SYSTEM_DEADLINE_SECONDS,
+                    )
+                finally:
+                    # Cancelling the coroutine does not free its EXECUTOR
+                    # thread. Keep the slot until the fetch returns, otherwise
+                    # the next system queues behind the stuck thread and its
+                    # own deadline runs out while it waits.
+                    pending = [future for future in in_flight if not future.done()]
+                    if pending:
+                        await asyncio.wait([asyncio.wrap_future(future) for future in pending])
+        
+        logger.info("Processing %d systems with %d concurrent workers...", len(due_systems), MAX_CONCURRENT_SYSTEMS)
         start_time = datetime.now()
         
         # Execute all tasks concurrently!
         results = await asyncio.gather(
-            *[bounded_task(task) for task in tasks], 
+            *[bounded_task(system_name) for system_name in due_systems], 
             return_exceptions=True
         )
         
         elapsed = (datetime.now() - start_time).total_seconds()
         
+        await flush_system_check_updates(check_updates, critical_systems, redis_client)
+        
+        timed_out = [
+            system_name for system_name, result in zip(due_systems, results)
+            if isinstance(result, asyncio.TimeoutError)
+        ]
+        if timed_out:
+            logger.warning("TIMEOUT: %d system(s) exceeded %ss: %s", len(timed_out), SYSTEM_DEADLINE_SECONDS, timed_out)
+        
         # Filter successful results
         temperature_results = [
             result for result in results 
             if result is not None and not isinstance(result, Exception)
         ]
         
-        print(f"\n{'=' * 80}")
-        print(f"COMPLETED: {len(temperature_results)}/{len(all_systems)} systems in {elapsed:.1f}s")
-        print(f"Throughput: {len(all_systems)/elapsed:.1f} systems/sec")
-        print(f"{'=' * 80}\n")
+        logger.info("COMPLETED: %d/%d systems in %.1fs (%.1f systems/sec)",
+                    len(temperature_results), len(all_systems), elapsed, len(due_systems) / max(elapsed, 1e-3))
 
         # Save to database
         if temperature_results:
-            print(f"Saving {len(temperature_results)} records to database...")
+            logger.debug("Saving %d records to database...", len(temperature_results))
             system_temp = SystemTemperature()
             successful = 0
             
-            for temp_data in temperature_results:
-                try:
-                    system_temp.create(temp_data)
-                    successful += 1
-                except Exception as e:
-                    print(f"DB error for {temp_data['system']}: {e}")
+            try:
+                successful = system_temp.create_many(temperature_results)
+            except Exception as e:
+                logger.error("DB error saving system temperatures: %s", e)
             
-            print(f"Saved {successful}/{len(temperature_results)} records")
+            logger.info("Saved %d/%d records", successful, len(temperature_results))
         else:
-            print("No temperature data collected")
+            logger.info("No temperature data collected")
+
+    except Exception:
+        logger.exception("Error in async temperature fetch")
+    finally:
+        await redis_client.aclose()
+
+@task_postrun.connect
+def publish_task_metrics(**kwargs):
+    """Push the gauge values a task set to Redis once it finishes."""
+    published = flush_gauges(_REDIS)
+    if published:
+        print(f"[METRICS] Published {published} gauge values to Redis")
 
-    except Exception as e:
-        print(f"Error in async temperature fetch: {e}")
-        import traceback
-        traceback.print_exc()
 
 @shared_task
 def say_hello():
     print("Hello from Celery!")
 
 
+# SNMP clients per (hostname, community), built with the PDU's address
+# resolved once. A failed fetch drops the entry so the next cycle re-resolves.
+_SNMP_CLIENTS = {}
+
+
+async def _get_snmp_client(pdu_hostname: str, v2c: str):
+    key = (pdu_hostname, v2c)
+    client = _SNMP_CLIENTS.get(key)
+    if client is None:
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(
+                pdu_hostname, 161, family=socket.AF_INET, type=socket.SOCK_DGRAM
+            )
+            address = infos[0][4][0]
+        except OSError:
+            address = pdu_hostname
+        client = Client(address, V2C(v2c))
+        _SNMP_CLIENTS[key] = client
+    return client
+
+
 async def snmpFetch(pdu_hostname: str, oid: str, v2c: str, type: str):
     try:
-        client = Client(pdu_hostname, V2C(v2c))
+        client = await _get_snmp_client(pdu_hostname, v2c)
         data = await client.get(OID(oid))
         if not data:
             return None
@@ -761,95 +1083,177 @@ async def snmpFetch(pdu_hostname: str, oid: str, v2c: str, type: str):
             return int(data.value)
     except Exception as e:
         print(f"snmpFetch error for {pdu_hostname} oid {oid}: {e}")
+        _SNMP_CLIENTS.pop((pdu_hostname, v2c), None)
         return None
 
 
+async def snmp_fetch_many(targets, v2c: str, type: str):
+    """
+    Fetch one OID from many PDUs concurrently on a single event loop.
+    targets is a list of (hostname, oid); results come back in the same order.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SNMP)
+
+    async def bounded_fetch(hostname, oid):
+        async with semaphore:
+            return await snmpFetch(hostname, oid, v2c, type)
+
+    return await asyncio.gather(
+        *[bounded_fetch(hostname, oid) for hostname, oid in targets]
+    )
+
+
+@functools.lru_cache(maxsize=4096)
 def determine_system_type(system_name: str):
-    """Determine system type based on system name prefix."""
-    system_name_lower = (system_name or "").lower()
-    if system_name_lower.startswith("smci"):
-        return "smci"
-    elif system_name_lower.startswith("miramar"):
-        return "miramar"
-    elif system_name_lower.startswith("gbt"):
-        return "gbt"
-    elif system_name_lower.startswith("quanta"):
-        return "quanta"
-    elif system_name_lower.startswith("banff"):
-        return "banff"
-    elif system_name_lower.startswith("dell"):
-        return "dell"
-    elif system_name_lower.startswith("gt"):
-        return "gt"
-    else:
-        return "unknown"
+    """Determine system type based on system name prefix (memoized; the fleet's names rarely change)."""
+    match = SYSTEM_TYPE_RE.match(system_name or "")
+    return match.group(1).lower() if match else "unknown"
+
+
+# Persistent SSH connections, one per (host, username), reused across polls.
+# Each fetch opens a fresh channel on the cached transport; the per-key lock
+# keeps two threads from racing to connect to the same BMC.
+SSH_CONNECT_TIMEOUT = 15
+SSH_KEEPALIVE_SECONDS = 30
+# Connections unused for this long (system removed or renamed) are closed
+SSH_IDLE_SECONDS = 15 * 60
+_SSH_CLIENTS = {}
+_SSH_LAST_USED = {}
+_SSH_KEY_LOCKS = {}
+_SSH_LOCK = threading.Lock()
+
+
+def _get_ssh_client(host: str, username: str, password: str):
+    """Return a connected SSHClient for host, reconnecting if the transport died."""
+    key = (host, username)
+    with _SSH_LOCK:
+        now = time.monotonic()
+        _evict_idle_ssh_clients(now)
+        _SSH_LAST_USED[key] = now
+        key_lock = _SSH_KEY_LOCKS.setdefault(key, threading.Lock())
+
+    with key_lock:
+        client = _SSH_CLIENTS.get(key)
+        transport = client.get_transport() if client else None
+        if transport is not None and transport.is_active():
+            return client
+
+        if client:
+            client.close()
+
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        client.connect(host, username=username, password=password, timeout=SSH_CONNECT_TIMEOUT,
+                       look_for_keys=False, allow_agent=False)
+        client.get_transport().set_keepalive(SSH_KEEPALIVE_SECONDS)
+        _SSH_CLIENTS[key] = client
+        return client
+
+
+def _evict_idle_ssh_clients(now: float):
+    """Close cached connections idle past SSH_IDLE_SECONDS. Caller holds _SSH_LOCK."""
+    for key, last_used in list(_SSH_LAST_USED.items()):
+        if now - last_used > SSH_IDLE_SECONDS:
+            del _SSH_LAST_USED[key]
+            _SSH_KEY_LOCKS.pop(key, None)
+            client = _SSH_CLIENTS.pop(key, None)
+            if client:
+                client.close()
+
+
+def _drop_ssh_client(host: str, username: str, force: bool = False):
+    """
+    Forget a cached connection after an error so the next poll reconnects.
+    A connection can be shared by several threads (every Banff system goes
+    through one rack manager), so a failed command on one channel only drops
+    it when the transport itself is dead, or when force is set (auth errors).
+    """
+    key = (host, username)
+    with _SSH_LOCK:
+        key_lock = _SSH_KEY_LOCKS.setdefault(key, threading.Lock())
+
+    with key_lock:
+        client = _SSH_CLIENTS.get(key)
+        if client is None:
+            return
+        transport = client.get_transport()
+        if force or transport is None or not transport.is_active():
+            del _SSH_CLIENTS[key]
+            client.close()
+
+
+# Pool processes can leave through os._exit, which skips atexit, so the
+# cached connections are also closed on Celery's per-process shutdown signal
+@worker_process_shutdown.connect
+@atexit.register
+def _close_ssh_clients(**kwargs):
+    with _SSH_LOCK:
+        clients = list(_SSH_CLIENTS.values())
+        _SSH_CLIENTS.clear()
+        _SSH_LAST_USED.clear()
+    for client in clients:
+        client.close()
 
 
 def fetch_gpu_temperatures_dell_ssh(bmc_ip: str, username: str, password: str, system_name: str):
     """
-    OPTIMIZED Dell SSH function
-    - Reduced initial wait: 2s → 1s
-    - Reduced root shell wait: 5s → 2s  
-    - Reduced per-GPU wait: 2s → 1s
-    
-    Total time saved: ~40% faster per Dell system
+    Fetch GPU temperatures for Dell systems via the iDRAC root shell.
+    One exec_command starts the root shell and feeds it a script that runs
+    all 8 per-GPU Redfish curls in parallel, then exits. Output is read in
+    chunks until all 8 GPU<n>TEMP lines are in, EOF, or DELL_SSH_TIMEOUT,
+    so a shell that never closes the channel still yields what it printed.
+    Returns a list of 8 temperatures (indexed 0-7) or None if failed.
     """
-    import time  # Still need time.sleep here as this runs in thread pool
-    
     try:
-        ssh = paramiko.SSHClient()
-        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        ssh.connect(bmc_ip, username=username, password=password, timeout=15, 
-                   look_for_keys=False, allow_agent=False)
-        
-        shell = ssh.invoke_shell()
-        shell.settimeout(15)
-        
-        time.sleep(1)  # Reduced from 2s
-        if shell.recv_ready():
-            _ = shell.recv(65535).decode('utf-8', errors='ignore')
+        ssh = _get_ssh_client(bmc_ip, username, password)
 
-        shell.send("racadm debug invoke rootshellash\n")
-        time.sleep(2)  # Reduced from 5s
-        
-        if shell.recv_ready():
-            _ = shell.recv(65535).decode('utf-8', errors='ignore')
-
-        gpu_temps = [None] * 8
+        # rootshellash only reads commands from a terminal, hence the pty
+        stdin, stdout, _ = ssh.exec_command(
+            "racadm debug invoke rootshellash", timeout=DELL_SSH_TIMEOUT, get_pty=True
+        )
+        stdin.write(DELL_GPU_TEMP_SCRIPT)
+        stdin.flush()
 
-        for gpu_num in range(8):
-            marker = f"GPU{gpu_num}TEMP"
-            curl_cmd = (
-                f"curl -s http://192.168.31.1/redfish/v1/Chassis/OAM_{gpu_num}/"
-                f"ThermalSubsystem/ThermalMetrics 2>/dev/null | "
-                f"awk '/GPU_{gpu_num}_DIE_TEMP/{{f=1}} f && /ReadingCelsius/"
-                f"{{print \"{marker}:\" $2; exit}}'\n"
-            )
-            
-            shell.send(curl_cmd)
-            time.sleep(1)  # Reduced from 2s
-            
-            if shell.recv_ready():
-                output = shell.recv(65535).decode('utf-8', errors='ignore')
-                
-                if marker in output:
-                    for line in output.split("\n"):
-                        if line.strip().startswith(f"{marker}:"):
-                            try:
-                                temp = float(line.split(":", 1)[1].strip())
-                                gpu_temps[gpu_num] = temp
-                            except:
-                                pass
-                            break
+        channel = stdout.channel
+        deadline = time.monotonic() + DELL_SSH_TIMEOUT
+        received = b""
+        eof = False
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                channel.settimeout(remaining)
+                try:
+                    data = channel.recv(4096)
+                except socket.timeout:
+                    break
+                if not data:
+                    eof = True
+                    break
+                received += data
+                # Count complete lines only, a partial "GPU7TEMP:4" would misparse
+                complete = received[:received.rfind(b"\n") + 1].decode('utf-8', errors='ignore')
+                if len({gpu for gpu, _ in DELL_GPU_TEMP_RE.findall(complete)}) >= 8:
+                    break
+        finally:
+            # Only this channel; the cached transport stays up for the next poll
+            channel.close()
 
-        shell.close()
-        ssh.close()
+        # Without EOF the last line may have been cut off mid-read
+        if not eof:
+            received = received[:received.rfind(b"\n") + 1]
+        output = received.decode('utf-8', errors='ignore')
+        gpu_temps = [None] * 8
+        for gpu_num, temp in DELL_GPU_TEMP_RE.findall(output):
+            gpu_temps[int(gpu_num)] = float(temp)
 
         valid_temps = [t for t in gpu_temps if t is not None]
         return gpu_temps if len(valid_temps) > 0 else None
 
     except Exception as e:
-        print(f"[DELL] Error: {e}")
+        logger.warning("[DELL] Error: %s", e)
+        _drop_ssh_client(bmc_ip, username, force=isinstance(e, paramiko.AuthenticationException))
         return None
 
 def fetch_gpu_temperatures_banff_ssh(rack_manager_ip: str, username: str, password: str, system_name: str):
@@ -860,29 +1264,18 @@ def fetch_gpu_temperatures_banff_ssh(rack_manager_ip: str, username: str, passwo
     Returns a list of 8 temperatures (indexed 0-7) or None if failed.
     """
     try:
-        print(f"Attempting Banff SSH connection to {rack_manager_ip}")
+        logger.debug("Attempting Banff SSH connection to %s", rack_manager_ip)
 
         # Extract rack ID from last number of system name
-        match = re.search(r'(\d+)$', system_name)
+        match = RACK_ID_RE.search(system_name)
         if not match:
-            print(f"Could not extract rack ID from system name: {system_name}")
+            logger.warning("Could not extract rack ID from system name: %s", system_name)
             return None
         rack_id = int(match.group(1))
-        print(f"Using rack ID {rack_id} for system {system_name}")
-
-        # Create SSH client
-        ssh = paramiko.SSHClient()
-        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-
-        # Connect with timeout
-        ssh.connect(
-            rack_manager_ip,
-            username=username,
-            password=password,
-            timeout=15,
-            look_for_keys=False,
-            allow_agent=False
-        )
+        logger.debug("Using rack ID %s for system %s", rack_id, system_name)
+
+        # Reuse the rack manager connection; it serves every rack's system
+        ssh = _get_ssh_client(rack_manager_ip, username, password)
 
         # Execute the command with dynamic rack ID
         command = f"set sys cmd -i {rack_id} -c sdr"
@@ -892,13 +1285,11 @@ def fetch_gpu_temperatures_banff_ssh(rack_manager_ip: str, username: str, passwo
         output = stdout.read().decode('utf-8')
         error = stderr.read().decode('utf-8')
 
-        ssh.close()
-
         if error:
-            print(f"SSH command error for {rack_manager_ip}: {error}")
+            logger.warning("SSH command error for %s: %s", rack_manager_ip, error)
 
         if not output:
-            print(f"No output from SSH command for {rack_manager_ip}")
+            logger.warning("No output from SSH command for %s", rack_manager_ip)
             return None
 
         # Parse the output for GPU temperatures
@@ -906,309 +1297,361 @@ def fetch_gpu_temperatures_banff_ssh(rack_manager_ip: str, username: str, passwo
 
         # Look for GPU temperature lines in the format:
         # GPU_X_DIE_TEMP | XX degrees C | ok
-        for line in output.split('\n'):
-            for gpu_num in range(8):
-                pattern = f"GPU_{gpu_num}_DIE_TEMP"
-                if pattern in line:
-                    match = re.search(r'(\d+(?:\.\d+)?)\s*degrees?\s*C', line, re.IGNORECASE)
-                    if match:
-                        try:
-                            temp = float(match.group(1))
-                            gpu_temps[gpu_num] = temp
-                            print(f"  Found GPU_{gpu_num}_DIE_TEMP: {temp}°C")
-                        except ValueError:
-                            print(f"  Could not parse temperature for GPU_{gpu_num}: {match.group(1)}")
-                    break
+        # One scan over the whole output; '.' never crosses a newline, so
+        # each match stays within its SDR line
+        for match in BANFF_GPU_TEMP_RE.finditer(output):
+            gpu_num = int(match.group(1))
+            temp = float(match.group(2))
+            gpu_temps[gpu_num] = temp
+            logger.debug("Found GPU_%d_DIE_TEMP: %s°C", gpu_num, temp)
 
         valid_temps = [t for t in gpu_temps if t is not None]
         if len(valid_temps) == 0:
-            print(f"No valid GPU temperatures found in output for {rack_manager_ip}")
-            print(f"Raw output (first 500 chars): {output[:500]}")
+            logger.warning("No valid GPU temperatures found in output for %s", rack_manager_ip)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Raw output (first 500 chars): %s", output[:500])
             return None
 
-        print(f"Successfully retrieved {len(valid_temps)}/8 GPU temperatures from {rack_manager_ip}")
+        logger.debug("Successfully retrieved %d/8 GPU temperatures from %s", len(valid_temps), rack_manager_ip)
         return gpu_temps
 
     except paramiko.AuthenticationException:
-        print(f"SSH authentication failed for {rack_manager_ip}")
+        logger.warning("SSH authentication failed for %s", rack_manager_ip)
+        _drop_ssh_client(rack_manager_ip, username, force=True)
         return None
     except paramiko.SSHException as e:
-        print(f"SSH connection error for {rack_manager_ip}: {e}")
+        logger.warning("SSH connection error for %s: %s", rack_manager_ip, e)
+        _drop_ssh_client(rack_manager_ip, username)
         return None
-    except Exception as e:
-        print(f"Unexpected error fetching Banff temperatures from {rack_manager_ip}: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Unexpected error fetching Banff temperatures from %s", rack_manager_ip)
+        _drop_ssh_client(rack_manager_ip, username)
         return None
 
 
-def fetch_gpu_temperatures_redfish(bmc_ip: str, username: str, password: str, system_type: str):
+# GT sensor IDs for GPUs 0-7
+GT_GPU_SENSOR_IDS = (51, 59, 67, 75, 83, 91, 99, 107)
+
+# Thermal array sensor ids: Miramar MemberId "TEMP_MI300_GPU<n>",
+# Gigabyte Name "GPU_<n>_..._DIE_TEMP"; one match per sensor replaces
+# the prefix/suffix tests plus replace()/split() parsing
+MIRAMAR_GPU_SENSOR_RE = re.compile(r'TEMP_MI300_GPU(\d+)$')
+GBT_GPU_SENSOR_RE = re.compile(r'GPU_(\d+)(?:_.*)?_DIE_TEMP$')
+
+
+@functools.lru_cache(maxsize=1024)
+def _redfish_auth_headers(username: str, password: str):
     """
-    Fetch GPU temperatures for all 8 GPUs using Redfish API with retry logic.
-    Returns a list of 8 temperatures (indexed 0-7) or None if failed.
+    Basic auth header for a BMC login, encoded once and shared by every read
+    (many BMCs share a login). Passed as headers= instead of auth= so requests
+    does not rebuild an HTTPBasicAuth for each of the per-GPU sensor reads.
     """
+    token = base64.b64encode(f"{username}:{password}".encode("latin1")).decode("ascii")
+    return {"Authorization": f"Basic {token}"}
 
-    def attempt_fetch():
-        """Single attempt to fetch GPU temperatures"""
-        try:
-            if system_type == "smci":
-                # SMCI: GPUs numbered 1-8
-                url = f"https://{bmc_ip}/redfish/v1/Chassis/1/Thermal"
-                response = requests.get(url, auth=(username, password), verify=False, timeout=15)
-                if response.status_code != 200:
-                    print(f"SMCI request failed for {bmc_ip}: HTTP {response.status_code}")
-                    return None
 
-                try:
-                    thermal_data = response.json()
-                except json.JSONDecodeError as e:
-                    print(f"SMCI JSON decode error for {bmc_ip}: {e}")
-                    return None
+def _fetch_smci_gpu_temps(bmc_ip: str, username: str, password: str):
+    """SMCI Redfish GPU temperatures (list of 8, None when unreadable)."""
+    # SMCI: GPUs numbered 1-8
+    url = f"https://{bmc_ip}/redfish/v1/Chassis/1/Thermal"
+    response = _SESSION.get(url, headers=_redfish_auth_headers(username, password), timeout=REDFISH_TIMEOUT)
+    if response.status_code != 200:
+        logger.warning("SMCI request failed for %s: HTTP %s", bmc_ip, response.status_code)
+        return None
 
-                gpu_temps = [None] * 8
-                for temp_sensor in thermal_data.get("Temperatures", []):
-                    if temp_sensor.get("Name") == "UBB GPU Temp":
-                        oem_details = temp_sensor.get("Oem", {}).get("Supermicro", {}).get("Details", {})
-                        for gpu_num in range(1, 9):
-                            gpu_key = f"UBB GPU {gpu_num} Temp"
-                            if gpu_key in oem_details:
-                                try:
-                                    gpu_temps[gpu_num - 1] = float(oem_details[gpu_key])
-                                except (ValueError, TypeError):
-                                    gpu_temps[gpu_num - 1] = None
-                        break
-                return gpu_temps
-
-            elif system_type == "miramar":
-                # Miramar: GPUs numbered 0-7
-                url = f"https://{bmc_ip}/redfish/v1/Chassis/Miramar_Sensor/Thermal"
-                response = requests.get(url, auth=(username, password), verify=False, timeout=15)
-                if response.status_code != 200:
-                    print(f"Miramar request failed for {bmc_ip}: HTTP {response.status_code}")
-                    return None
+    try:
+        thermal_data = _json_loads(response.content)
+    except json.JSONDecodeError as e:
+        logger.warning("SMCI JSON decode error for %s: %s", bmc_ip, e)
+        return None
+
+    gpu_temps = [None] * 8
+    for temp_sensor in thermal_data.get("Temperatures", []):
+        if temp_sensor.get("Name") == "UBB GPU Temp":
+            oem_details = temp_sensor.get("Oem", {}).get("Supermicro", {}).get("Details", {})
+            for gpu_num in range(1, 9):
+                gpu_key = f"UBB GPU {gpu_num} Temp"
+                if gpu_key in oem_details:
+                    try:
+                        gpu_temps[gpu_num - 1] = float(oem_details[gpu_key])
+                    except (ValueError, TypeError):
+                        gpu_temps[gpu_num - 1] = None
+            break
+    return gpu_temps
+
+
+def _fetch_miramar_gpu_temps(bmc_ip: str, username: str, password: str):
+    """Miramar Redfish GPU temperatures (list of 8, None when unreadable)."""
+    # Miramar: GPUs numbered 0-7
+    url = f"https://{bmc_ip}/redfish/v1/Chassis/Miramar_Sensor/Thermal"
+    response = _SESSION.get(url, headers=_redfish_auth_headers(username, password), timeout=REDFISH_TIMEOUT)
+    if response.status_code != 200:
+        logger.warning("Miramar request failed for %s: HTTP %s", bmc_ip, response.status_code)
+        return None
+
+    try:
+        thermal_data = _json_loads(response.content)
+    except json.JSONDecodeError as e:
+        logger.warning("Miramar JSON decode error for %s: %s", bmc_ip, e)
+        return None
+
+    gpu_temps = [None] * 8
+    for temp_sensor in thermal_data.get("Temperatures", []):
+        match = MIRAMAR_GPU_SENSOR_RE.match(temp_sensor.get("MemberId", ""))
+        if match:
+            gpu_num = int(match.group(1))
+            if 0 <= gpu_num <= 7:
+                reading = temp_sensor.get("ReadingCelsius")
+                if reading is not None and 0 <= reading <= 200:
+                    gpu_temps[gpu_num] = float(reading)
+    return gpu_temps
+
+
+def _fetch_gbt_gpu_temps(bmc_ip: str, username: str, password: str):
+    """Gigabyte Redfish GPU temperatures (list of 8, None when unreadable)."""
+    # Gigabyte: GPUs numbered 0-7
+    url = f"https://{bmc_ip}/redfish/v1/Chassis/1/Thermal"
+    response = _SESSION.get(url, headers=_redfish_auth_headers(username, password), timeout=REDFISH_TIMEOUT)
+    if response.status_code != 200:
+        logger.warning("Gigabyte request failed for %s: HTTP %s", bmc_ip, response.status_code)
+        return None
+
+    try:
+        thermal_data = _json_loads(response.content)
+    except json.JSONDecodeError as e:
+        logger.warning("Gigabyte JSON decode error for %s: %s", bmc_ip, e)
+        return None
 
+    gpu_temps = [None] * 8
+    for temp_sensor in thermal_data.get("Temperatures", []):
+        match = GBT_GPU_SENSOR_RE.match(temp_sensor.get("Name", ""))
+        if match:
+            gpu_num = int(match.group(1))
+            if 0 <= gpu_num <= 7:
+                reading = temp_sensor.get("ReadingCelsius")
+                if reading is not None and 0 <= reading <= 200:
+                    gpu_temps[gpu_num] = float(reading)
+    return gpu_temps
+
+
+def _fetch_quanta_gpu_temps(bmc_ip: str, username: str, password: str):
+    """Quanta Redfish GPU temperatures (list of 8, None when unreadable)."""
+    # Quanta: GPUs numbered 0-7, individual chassis/sensor per GPU
+    base_url = f"https://{bmc_ip}/redfish/v1/Chassis"
+    headers = _redfish_auth_headers(username, password)
+
+    def fetch_quanta_gpu(gpu_num):
+        try:
+            url = f"{base_url}/GPU_{gpu_num}/Sensors/GPU_{gpu_num}_Temp_0"
+            response = _SESSION.get(url, headers=headers, timeout=REDFISH_SENSOR_TIMEOUT)
+            if response.status_code == 200:
                 try:
-                    thermal_data = response.json()
-                except json.JSONDecodeError as e:
-                    print(f"Miramar JSON decode error for {bmc_ip}: {e}")
+                    sensor_data = _json_loads(response.content)
+                except json.JSONDecodeError:
+                    logger.warning("Quanta GPU_%d JSON decode error for %s", gpu_num, bmc_ip)
                     return None
+                reading = sensor_data.get("Reading")
+                if reading is not None and 0 <= reading <= 200:
+                    try:
+                        return float(reading)
+                    except (ValueError, TypeError):
+                        return None
+            else:
+                logger.warning("Quanta GPU_%d request failed for %s: HTTP %s", gpu_num, bmc_ip, response.status_code)
+        except requests.exceptions.Timeout:
+            logger.warning("Quanta GPU_%d request timed out for %s", gpu_num, bmc_ip)
+        except requests.exceptions.RequestException as e:
+            logger.warning("Quanta GPU_%d request exception for %s: %s", gpu_num, bmc_ip, e)
+        return None
 
-                gpu_temps = [None] * 8
-                for temp_sensor in thermal_data.get("Temperatures", []):
-                    member_id = temp_sensor.get("MemberId", "")
-                    if member_id.startswith("TEMP_MI300_GPU"):
-                        try:
-                            gpu_num = int(member_id.replace("TEMP_MI300_GPU", ""))
-                            if 0 <= gpu_num <= 7:
-                                reading = temp_sensor.get("ReadingCelsius")
-                                if reading is not None and 0 <= reading <= 200:
-                                    gpu_temps[gpu_num] = float(reading)
-                        except ValueError:
-                            continue
-                return gpu_temps
-
-            elif system_type == "gbt":
-                # Gigabyte: GPUs numbered 0-7
-                url = f"https://{bmc_ip}/redfish/v1/Chassis/1/Thermal"
-                response = requests.get(url, auth=(username, password), verify=False, timeout=15)
-                if response.status_code != 200:
-                    print(f"Gigabyte request failed for {bmc_ip}: HTTP {response.status_code}")
-                    return None
+    # The 8 sensor reads overlap, so a system costs one RTT, not eight
+    return list(REDFISH_SENSOR_EXECUTOR.map(fetch_quanta_gpu, range(8)))
 
+
+def _fetch_gt_gpu_temps(bmc_ip: str, username: str, password: str):
+    """GT Redfish GPU temperatures (list of 8, None when unreadable)."""
+    # GT: GPUs numbered 0-7, one UBB sensor per GPU (see GT_GPU_SENSOR_IDS)
+    # GT systems use port 8080 for Redfish API
+    base_url = f"http://{bmc_ip}:8080/redfish/v1/Chassis/1/Sensors"
+    headers = _redfish_auth_headers(username, password)
+
+    def fetch_gt_gpu(gpu_num, sensor_id):
+        try:
+            url = f"{base_url}/ubb_{sensor_id}"
+            response = _SESSION.get(url, headers=headers, timeout=REDFISH_SENSOR_TIMEOUT)
+
+            if response.status_code == 200:
                 try:
-                    thermal_data = response.json()
-                except json.JSONDecodeError as e:
-                    print(f"Gigabyte JSON decode error for {bmc_ip}: {e}")
+                    sensor_data = _json_loads(response.content)
+                except json.JSONDecodeError:
+                    logger.warning("GT GPU_%d (sensor ubb_%s) JSON decode error for %s", gpu_num, sensor_id, bmc_ip)
                     return None
 
-                gpu_temps = [None] * 8
-                for temp_sensor in thermal_data.get("Temperatures", []):
-                    name = temp_sensor.get("Name", "")
-                    if name.startswith("GPU_") and name.endswith("_DIE_TEMP"):
-                        try:
-                            gpu_num = int(name.split("_")[1])
-                            if 0 <= gpu_num <= 7:
-                                reading = temp_sensor.get("ReadingCelsius")
-                                if reading is not None and 0 <= reading <= 200:
-                                    gpu_temps[gpu_num] = float(reading)
-                        except (ValueError, IndexError):
-                            continue
-                return gpu_temps
-
-            elif system_type == "quanta":
-                # Quanta: GPUs numbered 0-7, individual chassis/sensor per GPU
-                gpu_temps = [None] * 8
-                for gpu_num in range(8):
-                    try:
-                        url = f"https://{bmc_ip}/redfish/v1/Chassis/GPU_{gpu_num}/Sensors/GPU_{gpu_num}_Temp_0"
-                        response = requests.get(url, auth=(username, password), verify=False, timeout=10)
-                        if response.status_code == 200:
-                            try:
-                                sensor_data = response.json()
-                            except json.JSONDecodeError:
-                                print(f"Quanta GPU_{gpu_num} JSON decode error for {bmc_ip}")
-                                continue
-                            reading = sensor_data.get("Reading")
-                            if reading is not None and 0 <= reading <= 200:
-                                try:
-                                    gpu_temps[gpu_num] = float(reading)
-                                except (ValueError, TypeError):
-                                    gpu_temps[gpu_num] = None
-                        else:
-                            print(f"Quanta GPU_{gpu_num} request failed for {bmc_ip}: HTTP {response.status_code}")
-                    except requests.exceptions.Timeout:
-                        print(f"Quanta GPU_{gpu_num} request timed out for {bmc_ip}")
-                        continue
-                    except requests.exceptions.RequestException as e:
-                        print(f"Quanta GPU_{gpu_num} request exception for {bmc_ip}: {e}")
-                        continue
-                return gpu_temps
-
-            elif system_type == "gt":
-                # GT: GPUs numbered 0-7, using specific UBB sensor IDs
-                # Sensor IDs: 51, 59, 67, 75, 83, 91, 99, 107 (corresponding to GPUs 0-7)
-                sensor_ids = [51, 59, 67, 75, 83, 91, 99, 107]
-                gpu_temps = [None] * 8
-                
-                for gpu_num, sensor_id in enumerate(sensor_ids):
+                # GT returns temperature in "Reading" field
+                reading = sensor_data.get("Reading")
+                if reading is not None and 0 <= reading <= 200:
                     try:
-                        # GT systems use port 8080 for Redfish API
-                        url = f"http://{bmc_ip}:8080/redfish/v1/Chassis/1/Sensors/ubb_{sensor_id}"
-                        response = requests.get(url, auth=(username, password), verify=False, timeout=10)
-                        
-                        if response.status_code == 200:
-                            try:
-                                sensor_data = response.json()
-                            except json.JSONDecodeError:
-                                print(f"GT GPU_{gpu_num} (sensor ubb_{sensor_id}) JSON decode error for {bmc_ip}")
-                                continue
-                            
-                            # GT returns temperature in "Reading" field
-                            reading = sensor_data.get("Reading")
-                            if reading is not None and 0 <= reading <= 200:
-                                try:
-                                    gpu_temps[gpu_num] = float(reading)
-                                    print(f"  GT GPU_{gpu_num} (ubb_{sensor_id}): {reading}°C")
-                                except (ValueError, TypeError):
-                                    print(f"  GT GPU_{gpu_num} invalid reading: {reading}")
-                                    gpu_temps[gpu_num] = None
-                        else:
-                            print(f"GT GPU_{gpu_num} (ubb_{sensor_id}) request failed for {bmc_ip}: HTTP {response.status_code}")
-                            
-                    except requests.exceptions.Timeout:
-                        print(f"GT GPU_{gpu_num} (ubb_{sensor_id}) request timed out for {bmc_ip}")
-                        continue
-                    except requests.exceptions.RequestException as e:
-                        print(f"GT GPU_{gpu_num} (ubb_{sensor_id}) request exception for {bmc_ip}: {e}")
-                        continue
-                
-                return gpu_temps
-
+                        temp = float(reading)
+                        logger.debug("GT GPU_%d (ubb_%s): %s°C", gpu_num, sensor_id, reading)
+                        return temp
+                    except (ValueError, TypeError):
+                        logger.warning("GT GPU_%d invalid reading: %s", gpu_num, reading)
+                        return None
             else:
-                print(f"Unknown system type: {system_type}")
-                return None
+                logger.warning("GT GPU_%d (ubb_%s) request failed for %s: HTTP %s", gpu_num, sensor_id, bmc_ip, response.status_code)
 
         except requests.exceptions.Timeout:
-            print(f"Redfish request timed out for {bmc_ip}")
-            return None
+            logger.warning("GT GPU_%d (ubb_%s) request timed out for %s", gpu_num, sensor_id, bmc_ip)
         except requests.exceptions.RequestException as e:
-            print(f"Request exception for {bmc_ip}: {e}")
-            return None
-        except Exception as e:
-            print(f"Exception during Redfish fetch for {bmc_ip}: {e}")
-            return None
+            logger.warning("GT GPU_%d (ubb_%s) request exception for %s: %s", gpu_num, sensor_id, bmc_ip, e)
+        return None
 
-    # First attempt
-    print(f"Attempting GPU temperature fetch for {bmc_ip} (type: {system_type})")
-    gpu_temperatures = attempt_fetch()
+    return list(REDFISH_SENSOR_EXECUTOR.map(fetch_gt_gpu, range(8), GT_GPU_SENSOR_IDS))
 
-    if gpu_temperatures is not None:
-        valid_temps = [t for t in gpu_temperatures if t is not None]
-        print(f"First attempt successful for {bmc_ip}: {len(valid_temps)}/8 GPUs reported")
-        return gpu_temperatures
 
-    # Retry once if first attempt failed
-    print(f"First attempt failed for {bmc_ip}, retrying...")
-    gpu_temperatures = attempt_fetch()
+# Redfish vendor handlers, looked up once per attempt by system type
+REDFISH_HANDLERS = {
+    "smci": _fetch_smci_gpu_temps,
+    "miramar": _fetch_miramar_gpu_temps,
+    "gbt": _fetch_gbt_gpu_temps,
+    "quanta": _fetch_quanta_gpu_temps,
+    "gt": _fetch_gt_gpu_temps,
+}
+
+# Vendors read over SSH instead of Redfish; each takes the system name in
+# place of the Redfish system type
+SSH_GPU_TEMP_FETCHERS = {
+    "banff": fetch_gpu_temperatures_banff_ssh,
+    "dell": fetch_gpu_temperatures_dell_ssh,
+}
+
+
+def fetch_gpu_temperatures_redfish(bmc_ip: str, username: str, password: str, system_type: str):
+    """
+    Fetch GPU temperatures for all 8 GPUs using Redfish API.
+    Transient HTTP failures are retried by the session adapter (see _REDFISH_ADAPTER).
+    Returns a list of 8 temperatures (indexed 0-7) or None if failed.
+    """
+    handler = REDFISH_HANDLERS.get(system_type)
+    if handler is None:
+        logger.warning("Unknown system type: %s", system_type)
+        return None
+
+    logger.debug("Attempting GPU temperature fetch for %s (type: %s)", bmc_ip, system_type)
+    try:
+        gpu_temperatures = handler(bmc_ip, username, password)
+    except requests.exceptions.Timeout:
+        logger.warning("Redfish request timed out for %s", bmc_ip)
+        return None
+    except requests.exceptions.RequestException as e:
+        logger.warning("Request exception for %s: %s", bmc_ip, e)
+        return None
+    except Exception as e:
+        logger.error("Exception during Redfish fetch for %s: %s", bmc_ip, e)
+        return None
 
     if gpu_temperatures is not None:
-        valid_temps = [t for t in gpu_temperatures if t is not None]
-        print(f"Retry successful for {bmc_ip}: {len(valid_temps)}/8 GPUs reported")
-        return gpu_temperatures
+        if logger.isEnabledFor(logging.DEBUG):
+            valid_temps = [t for t in gpu_temperatures if t is not None]
+            logger.debug("Fetch successful for %s: %d/8 GPUs reported", bmc_ip, len(valid_temps))
     else:
-        print(f"Both attempts failed for {bmc_ip}")
-        return None
+        logger.warning("Fetch failed for %s", bmc_ip)
+    return gpu_temperatures
+
+@functools.lru_cache(maxsize=1)
+def _load_bmc_credentials(cache_window):
+    """
+    Read every system's BMC credentials from the 'systems' collection.
+    Memoized per cache_window, so all polls inside one window share a single
+    query; errors propagate and are therefore never cached.
+    """
+    logger.info("Loading BMC credentials from database (systems collection)")
+    
+    # Fetch systems with BMC credentials from database
+    systems_model = Systems()
+    all_systems = systems_model.find({}, projection=SYSTEM_CREDENTIAL_PROJECTION)
+    
+    if not all_systems:
+        logger.warning("No systems found in database")
+        return {}
+    
+    credentials_dict = {}
+    
+    for system_record in all_systems:
+        system_name = system_record.get("system", "").strip()
+        
+        # Check if this system has BMC credentials
+        bmc_ip = system_record.get("bmc_ip", "").strip()
+        username = system_record.get("username", "").strip()
+        password = system_record.get("password", "").strip()
+        
+        # Skip systems without complete BMC credentials
+        if not (system_name and bmc_ip and username and password):
+            continue
+        
+        credentials_dict[system_name] = {
+            "bmc_ip": bmc_ip,
+            "username": username,
+            "password": password,
+            "system_type": determine_system_type(system_name),
+        }
+    
+    logger.info("Loaded BMC credentials for %d of %d systems (%d without credentials)",
+                len(credentials_dict), len(all_systems), len(all_systems) - len(credentials_dict))
+    
+    return credentials_dict
+
 
-def parse_bmc_credentials():
+def parse_bmc_credentials(system_names=None):
     """
     Parse BMC credentials from the 'systems' collection in database.
     Returns a dictionary mapping system names to their credentials.
+    The collection is re-read at most once per BMC_CREDENTIALS_CACHE_SECONDS.
+    
+    Args:
+        system_names: Optional iterable of system names to limit the lookup to
     
     Returns:
-        dict: {system_name: {"bmc_ip": str, "username": str, "password": str}}
+        dict: {system_name: {"bmc_ip": str, "username": str, "password": str, "system_type": str}}
     """
     try:
-        print("=== BMC CREDENTIALS LOADING FROM DATABASE (systems collection) ===")
-        
-        # Fetch systems with BMC credentials from database
-        systems_model = Systems()
-        all_systems = systems_model.find({})
-        
-        if not all_systems:
-            print("No systems found in database")
-            return {}
-        
-        print(f"Found {len(all_systems)} system records in database")
-        
-        credentials_dict = {}
-        systems_with_credentials = 0
-        
-        for system_record in all_systems:
-            system_name = system_record.get("system", "").strip()
-            
-            # Check if this system has BMC credentials
-            # Assuming credentials are stored in fields: bmc_ip, bmc_username, bmc_password
-            # Adjust field names based on your actual database schema
-            bmc_ip = system_record.get("bmc_ip", "").strip()
-            username = system_record.get("username", "").strip()
-            password = system_record.get("password", "").strip()
-            
-            # Skip systems without complete BMC credentials
-            if not (system_name and bmc_ip and username and password):
-                continue
-            
-            credentials_dict[system_name] = {
-                "bmc_ip": bmc_ip,
-                "username": username,
-                "password": password,
-            }
-            systems_with_credentials += 1
-            print(f"Loaded credentials for system: {system_name} (BMC: {bmc_ip})")
-        
-        print(f"Successfully loaded credentials for {systems_with_credentials} systems from database")
-        print(f"Systems without credentials: {len(all_systems) - systems_with_credentials}")
-        
-        return credentials_dict
-        
+        credentials = _load_bmc_credentials(int(time.monotonic() // BMC_CREDENTIALS_CACHE_SECONDS))
     except Exception as e:
         print(f"Error loading BMC credentials from database: {e}")
         import traceback
         traceback.print_exc()
         return {}
+    
+    if system_names:
+        return {name: credentials[name] for name in system_names if name in credentials}
+    return dict(credentials)
+
+# One event loop per worker process, run forever on a daemon thread, so
+# async tasks stop paying loop setup/teardown and loop-bound resources
+# survive between runs. Keyed by pid so a forked child starts its own.
+_ASYNC_LOOP = None
+_ASYNC_LOOP_PID = None
+_ASYNC_LOOP_LOCK = threading.Lock()
+
+
+def _get_async_loop():
+    """Return this process's long-lived event loop, starting it on first use."""
+    global _ASYNC_LOOP, _ASYNC_LOOP_PID
+    with _ASYNC_LOOP_LOCK:
+        if _ASYNC_LOOP is None or _ASYNC_LOOP_PID != os.getpid():
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="cron-asyncio", daemon=True).start()
+            _ASYNC_LOOP, _ASYNC_LOOP_PID = loop, os.getpid()
+        return _ASYNC_LOOP
+
 
 def run_async_safely(coro):
     """Run async code safely from sync context"""
-    import asyncio
     try:
-        loop = asyncio.get_running_loop()
+        asyncio.get_running_loop()
         return asyncio.ensure_future(coro)
     except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            return loop.run_until_complete(coro)
-        finally:
-            loop.close()
+        return asyncio.run_coroutine_threadsafe(coro, _get_async_loop()).result()
 
 
 @shared_task
@@ -1218,23 +1661,13 @@ def fetch_power_data():
     FIXED: Lock is now properly scoped and doesn't interfere with task execution.
     """
     try:
-        redis_host = str(os.environ.get("REDIS_HOST") or "localhost")
-        redis_port = int(os.environ.get("REDIS_PORT") or 6379)
-        redis_password = str(os.environ.get("REDIS_PASSWORD") or "")
-        
-        r = redis.Redis(
-            host=redis_host,
-            port=redis_port,
-            password=redis_password if redis_password else None,
-            db=0,
-            decode_responses=True
-        )
+        r = _REDIS
         
         # Try to acquire lock
         lock_key = "celery:lock:fetch_power_data"
-        lock_acquired = r.set(lock_key, "locked", nx=True, ex=1200)
+        lock_token = acquire_task_lock(r, lock_key, 1200)
         
-        if not lock_acquired:
+        if not lock_token:
             print("⏭️  SKIPPING power fetch: Lock already held by another worker")
             return "skipped_locked"
         
@@ -1250,50 +1683,53 @@ def fetch_power_data():
             print("Fetching PDU list from database...")
             pdu_model = PDU()
             all_pdu = pdu_model.find({})
-            
-            # Serialize datetime objects
-            for pdu in all_pdu:
-                if "created" in pdu and hasattr(pdu["created"], "isoformat"):
-                    pdu["created"] = pdu["created"].isoformat()
-                if "updated" in pdu and hasattr(pdu["updated"], "isoformat"):
-                    pdu["updated"] = pdu["updated"].isoformat()
-
-            r.setex("all_pdu", 259200, json.dumps(all_pdu))
+
+            # created/updated datetimes are written as ISO strings by _json_dumps
+            r.setex("all_pdu", 259200, _json_dumps(all_pdu))
         else:
             print("Using cached PDU list from Redis")
-            all_pdu = json.loads(all_pdu)
+            all_pdu = _json_loads(all_pdu)
 
         power_list = []
         created_time = datetime.now()
 
         print(f"Processing {len(all_pdu)} PDUs for power data...")
 
+        power_pdus = []
         for pdu in all_pdu:
+            if not all([pdu.get("hostname"), pdu.get("output_power_total_oid")]):
+                logger.debug("Skipping incomplete PDU: %s", pdu.get('hostname'))
+                continue
+            power_pdus.append(pdu)
+
+        # All PDUs are polled together; snmpFetch already returns None on error
+        power_readings = run_async_safely(
+            snmp_fetch_many(
+                [(pdu["hostname"], pdu["output_power_total_oid"]) for pdu in power_pdus],
+                SNMP_COMMUNITY,
+                "power",
+            )
+        )
+
+        for pdu, total_power in zip(power_pdus, power_readings):
             hostname = pdu.get("hostname")
             site = pdu.get("site")
             location = pdu.get("location")
-            output_power_total_oid = pdu.get("output_power_total_oid")
             system = pdu.get("system")
-
-            if not all([hostname, output_power_total_oid]):
-                print(f"Skipping incomplete PDU: {hostname}")
-                continue
-
-            total_power = run_async_safely(
-                snmpFetch(hostname, output_power_total_oid, "amd123", "power")
-            )
             total_power = total_power or 0
 
-            power_list.append(
-                {
-                    "site": site,
-                    "location": location,
-                    "pdu_hostname": hostname,
-                    "reading": total_power,
-                    "symbol": "W",
-                    **({"system": system} if system else {}),
-                }
-            )
+            power_data = {
+                "site": site,
+                "location": location,
+                "pdu_hostname": hostname,
+                "reading": total_power,
+                "symbol": "W",
+                "created": created_time,
+                "updated": created_time,
+            }
+            if system:
+                power_data["system"] = system
+            power_list.append(power_data)
 
         # Save to database with Prometheus metrics
         if power_list:
@@ -1310,16 +1746,11 @@ def fetch_power_data():
                         ).set(power_data.get("reading", 0))
                         metrics_recorded += 1
                     except Exception as e:
-                        print(f"[METRICS] Failed to record power metric for {power_data.get('pdu_hostname')}: {e}")
+                        logger.warning("[METRICS] Failed to record power metric for %s: %s", power_data.get('pdu_hostname'), e)
                 
-                # Insert to database
-                power.create(
-                    {
-                        **power_data,
-                        "created": created_time,
-                        "updated": created_time,
-                    }
-                )
+            
+            # Insert the whole cycle in one round trip
+            power.create_many(power_list)
             
             if POWER_GAUGE and metrics_recorded > 0:
                 print(f"[METRICS] Recorded {metrics_recorded} power metrics")
@@ -1386,7 +1817,7 @@ def fetch_power_data():
         # ── end Redis running totals ──────────────────────────────────────────
         
         # Release lock after successful completion
-        r.delete(lock_key)
+        release_task_lock(r, lock_key, lock_token)
         print("🔓 Power fetch: Lock released")
         
         return f"success_{len(power_list)}_readings"
@@ -1395,7 +1826,7 @@ def fetch_power_data():
         print(f"❌ Error in fetch_power_data: {e}")
         # Release lock on error
         try:
-            r.delete(lock_key)
+            release_task_lock(r, lock_key, lock_token)
             print("🔓 Lock released due to error")
         except:
             pass
@@ -1408,23 +1839,13 @@ def fetch_temperature_data():
     FIXED: Lock is now properly scoped and doesn't interfere with task execution.
     """
     try:
-        redis_host = str(os.environ.get("REDIS_HOST") or "localhost")
-        redis_port = int(os.environ.get("REDIS_PORT") or 6379)
-        redis_password = str(os.environ.get("REDIS_PASSWORD") or "")
-        
-        r = redis.Redis(
-            host=redis_host,
-            port=redis_port,
-            password=redis_password if redis_password else None,
-            db=0,
-            decode_responses=True  # Important for lock operations
-        )
+        r = _REDIS
         
         # Try to acquire lock (10 minute TTL, same as task interval)
         lock_key = "celery:lock:fetch_temperature_data"
-        lock_acquired = r.set(lock_key, "locked", nx=True, ex=600)
+        lock_token = acquire_task_lock(r, lock_key, 600)
         
-        if not lock_acquired:
+        if not lock_token:
             print("⏭️  SKIPPING temperature fetch: Lock already held by another worker")
             return "skipped_locked"
         
@@ -1441,44 +1862,44 @@ def fetch_temperature_data():
             print("Fetching PDU list from database...")
             pdu_model = PDU()
             temperature_pdu = pdu_model.find({"temperature": {"$exists": True}})
-            
-            # Serialize datetime objects
-            for pdu_item in temperature_pdu:
-                if "created" in pdu_item and hasattr(pdu_item["created"], "isoformat"):
-                    pdu_item["created"] = pdu_item["created"].isoformat()
-                if "updated" in pdu_item and hasattr(pdu_item["updated"], "isoformat"):
-                    pdu_item["updated"] = pdu_item["updated"].isoformat()
-
-            # Cache for 3 days
-            r.setex("temperature_pdu", 259200, json.dumps(temperature_pdu))
+
+            # Cache for 3 days; created/updated datetimes are written as ISO strings
+            r.setex("temperature_pdu", 259200, _json_dumps(temperature_pdu))
         else:
             print("Using cached PDU list from Redis")
-            temperature_pdu = json.loads(temperature_pdu)
+            temperature_pdu = _json_loads(temperature_pdu)
 
         temperature_list = []
         created_time = datetime.now()
 
         print(f"Processing {len(temperature_pdu)} PDUs for temperature data...")
 
+        temperature_pdus = []
         for pdu in temperature_pdu:
+            temperature_cfg = pdu.get("temperature", {})
+            if not all([pdu.get("hostname"), temperature_cfg.get("oid"), temperature_cfg.get("position")]):
+                logger.debug("Skipping incomplete PDU: %s", pdu.get('hostname'))
+                continue
+            temperature_pdus.append(pdu)
+
+        temperature_readings = run_async_safely(
+            snmp_fetch_many(
+                [(pdu["hostname"], pdu["temperature"]["oid"]) for pdu in temperature_pdus],
+                SNMP_COMMUNITY,
+                "temp",
+            )
+        )
+
+        for pdu, curr_temperature in zip(temperature_pdus, temperature_readings):
             hostname = pdu.get("hostname")
             site = pdu.get("site")
             location = pdu.get("location")
-            temperature_oid = pdu.get("temperature", {}).get("oid")
-            position = pdu.get("temperature", {}).get("position")
-
-            if not all([hostname, temperature_oid, position]):
-                print(f"Skipping incomplete PDU: {hostname}")
-                continue
+            position = pdu["temperature"]["position"]
 
-            print(f"  Fetching: {hostname} ({location}-{position})")
+            logger.debug("  Fetched: %s (%s-%s)", hostname, location, position)
 
-            curr_temperature = run_async_safely(
-                snmpFetch(hostname, temperature_oid, "amd123", "temp")
-            )
-            
             if curr_temperature is not None:
-                print(f"    ✓ Got {curr_temperature}°C")
+                logger.debug("    ✓ Got %s°C", curr_temperature)
                 temperature_list.append(
                     {
                         "site": site,
@@ -1486,10 +1907,12 @@ def fetch_temperature_data():
                         "pdu_hostname": hostname,
                         "reading": curr_temperature,
                         "symbol": "°C",
+                        "created": created_time,
+                        "updated": created_time,
                     }
                 )
             else:
-                print(f"    ✗ No data returned")
+                logger.debug("    ✗ No data returned")
 
         # Save to database with Prometheus metrics
         if temperature_list:
@@ -1505,16 +1928,11 @@ def fetch_temperature_data():
                         ).set(temperature_data.get("reading", 0))
                         metrics_recorded += 1
                     except Exception as e:
-                        print(f"[METRICS] Failed to record temperature metric for {temperature_data.get('pdu_hostname')}: {e}")
+                        logger.warning("[METRICS] Failed to record temperature metric for %s: %s", temperature_data.get('pdu_hostname'), e)
                 
-                # Insert to database
-                temperature.create(
-                    {
-                        **temperature_data,
-                        "created": created_time,
-                        "updated": created_time,
-                    }
-                )
+            
+            # Insert the whole cycle in one round trip
+            temperature.create_many(temperature_list)
             
             if TEMP_GAUGE and metrics_recorded > 0:
                 print(f"[METRICS] Recorded {metrics_recorded} temperature metrics")
@@ -1524,7 +1942,7 @@ def fetch_temperature_data():
             print("⚠️  No temperature data collected")
         
         # Release lock after successful completion
-        r.delete(lock_key)
+        release_task_lock(r, lock_key, lock_token)
         print("🔓 Temperature fetch: Lock released")
         
         return f"success_{len(temperature_list)}_readings"
@@ -1533,12 +1951,50 @@ def fetch_temperature_data():
         print(f"❌ Error in fetch_temperature_data: {e}")
         # Release lock on error
         try:
-            r.delete(lock_key)
+            release_task_lock(r, lock_key, lock_token)
             print("🔓 Lock released due to error")
         except:
             pass
         raise
 
+def fetch_gpu_temperatures_for_system(system_name, credentials):
+    """Fetch the 8 GPU temperatures for one system using its vendor's access method."""
+    bmc_ip = credentials["bmc_ip"]
+    username = credentials["username"]
+    password = credentials["password"]
+
+    system_type = credentials["system_type"]
+    logger.debug("Processing system: %s (BMC: %s, Type: %s)", system_name, bmc_ip, system_type)
+
+    # Banff (rack manager) and Dell (racadm) use SSH, other systems use Redfish
+    fetch = SSH_GPU_TEMP_FETCHERS.get(system_type)
+    if fetch is not None:
+        return fetch(bmc_ip, username, password, system_name)
+
+    return fetch_gpu_temperatures_redfish(bmc_ip, username, password, system_type)
+
+
+def record_gpu_temperature_metrics(system_name, gpu_temperatures):
+    """Update Prometheus metrics for each GPU"""
+    if not SYSTEM_GPU_TEMP_GAUGE:
+        logger.debug("[METRICS] SYSTEM_GPU_TEMP_GAUGE not available, skipping metric recording")
+        return
+
+    metrics_recorded = 0
+    for gpu_idx, temp in enumerate(gpu_temperatures):
+        if temp is not None:
+            try:
+                SYSTEM_GPU_TEMP_GAUGE.labels(
+                    system=system_name,
+                    gpu=str(gpu_idx)
+                ).set(temp)
+                metrics_recorded += 1
+            except Exception as e:
+                logger.warning("[METRICS] Failed to record metric for %s GPU %s: %s", system_name, gpu_idx, e)
+
+    logger.debug("[METRICS] Recorded %s GPU temperature metrics for %s", metrics_recorded, system_name)
+
+
 @shared_task
 def fetch_system_temperature_data():
     """
@@ -1562,7 +2018,7 @@ def fetch_system_temperature_data():
         print("Fetching systems from database...")
         try:
             systems_model = Systems()
-            all_systems = systems_model.find({})
+            all_systems = systems_model.find({}, projection=SYSTEM_NAME_PROJECTION)
             print(f"Found {len(all_systems)} systems in database")
         except Exception as e:
             print(f"Error fetching systems from database: {e}")
@@ -1573,62 +2029,36 @@ def fetch_system_temperature_data():
             return
 
         system_temperature_list = []
+        poll_results = []
         created_time = datetime.now()
-        matched_systems = 0
 
-        # Process each system from database
+        # Match each system from database with its BMC credentials
+        matched = []
         for system in all_systems:
             system_name = system.get("system")
             if not system_name:
-                print(f"System record missing system field: {system}")
+                logger.debug("System record missing system field: %s", system)
                 continue
 
             # Check if we have BMC credentials for this system
             if system_name not in bmc_credentials:
-                print(f"No BMC credentials found for system: {system_name}")
+                logger.debug("No BMC credentials found for system: %s", system_name)
                 continue
 
-            matched_systems += 1
-            credentials = bmc_credentials[system_name]
-            bmc_ip = credentials["bmc_ip"]
-            username = credentials["username"]
-            password = credentials["password"]
-
-            # Determine system type
-            system_type = determine_system_type(system_name)
-            print(f"Processing system: {system_name} (BMC: {bmc_ip}, Type: {system_type})")
+            matched.append((system_name, bmc_credentials[system_name]))
+        matched_systems = len(matched)
 
-            # Fetch GPU temperatures based on system type
-            if system_type == "banff":
-                # Banff uses SSH to rack manager instead of Redfish
-                gpu_temperatures = fetch_gpu_temperatures_banff_ssh(bmc_ip, username, password, system_name)
+        # The BMC reads are pure network wait, so up to MAX_CONCURRENT_SYSTEMS
+        # systems are fetched at once; results come back in input order
+        fetched = EXECUTOR.map(lambda item: fetch_gpu_temperatures_for_system(*item), matched)
 
-            elif system_type == "dell":
-                # Dell systems use SSH with racadm and local curl
-                gpu_temperatures = fetch_gpu_temperatures_dell_ssh(bmc_ip, username, password, system_name)
-
-            else:
-                # Other systems use Redfish
-                gpu_temperatures = fetch_gpu_temperatures_redfish(bmc_ip, username, password, system_type)
+        for (system_name, credentials), gpu_temperatures in zip(matched, fetched):
+            bmc_ip = credentials["bmc_ip"]
 
             if gpu_temperatures is not None:
-                # Update Prometheus metrics for each GPU
-                metrics_recorded = 0
-                if SYSTEM_GPU_TEMP_GAUGE:
-                    for gpu_idx, temp in enumerate(gpu_temperatures):
-                        if temp is not None:
-                            try:
-                                SYSTEM_GPU_TEMP_GAUGE.labels(
-                                    system=system_name,
-                                    gpu=str(gpu_idx)
-                                ).set(temp)
-                                metrics_recorded += 1
-                            except Exception as e:
-                                print(f"[METRICS] Failed to record metric for {system_name} GPU {gpu_idx}: {e}")
-                    
-                    print(f"[METRICS] Recorded {metrics_recorded} GPU temperature metrics for {system_name}")
-                else:
-                    print(f"[METRICS] SYSTEM_GPU_TEMP_GAUGE not available, skipping metric recording")
+                record_gpu_temperature_metrics(system_name, gpu_temperatures)
+                is_critical, _, _ = is_critical_temperature(gpu_temperatures)
+                poll_results.append((system_name, is_critical))
                 
                 # Create temperature record with GPU array
                 temp_data = {
@@ -1642,14 +2072,17 @@ def fetch_system_temperature_data():
                 system_temperature_list.append(temp_data)
 
                 valid_temps = [t for t in gpu_temperatures if t is not None]
-                print(f"Successfully collected temperatures for {system_name}: {len(valid_temps)}/8 GPUs")
-                print(f"GPU temps: {gpu_temperatures}")
+                logger.debug("Successfully collected temperatures for %s: %s/8 GPUs", system_name, len(valid_temps))
+                logger.debug("GPU temps: %s", gpu_temperatures)
             else:
-                print(f"Failed to collect GPU temperatures for {system_name} (BMC: {bmc_ip})")
-                print(f"FAILURE LOG: {system_name} - Could not retrieve data")
+                logger.warning("Failed to collect GPU temperatures for %s (BMC: %s)", system_name, bmc_ip)
+                logger.debug("FAILURE LOG: %s - Could not retrieve data", system_name)
 
         print(f"Processed {matched_systems} systems with BMC credentials out of {len(all_systems)} total systems")
 
+        # Systems at or above CRITICAL_TEMP_THRESHOLD get picked up by poll_critical_systems
+        update_critical_poll_schedule(poll_results, get_redis_client())
+
         # Upload to DB with detailed logging
         if system_temperature_list:
             print(f"Attempting to save {len(system_temperature_list)} GPU temperature records to database...")
@@ -1661,17 +2094,11 @@ def fetch_system_temperature_data():
                 successful_inserts = 0
                 failed_inserts = 0
 
-                for i, temp_data in enumerate(system_temperature_list):
-                    try:
-                        valid_gpus = len([t for t in temp_data["gpu_temperatures"] if t is not None])
-                        print(f"Inserting record {i+1}/{len(system_temperature_list)}: {temp_data['system']} - {valid_gpus}/8 GPUs")
-                        result = system_temp.create(temp_data)
-                        print(f"Database insert result: {result}")
-                        successful_inserts += 1
-                    except Exception as e:
-                        print(f"Failed to insert record {i+1} ({temp_data['system']}): {e}")
-                        print(f"Failed record data: {temp_data}")
-                        failed_inserts += 1
+                try:
+                    successful_inserts = system_temp.create_many(system_temperature_list)
+                except Exception as e:
+                    print(f"Failed to insert {len(system_temperature_list)} records: {e}")
+                    failed_inserts = len(system_temperature_list)
 
                 print(f"Database insertion complete: {successful_inserts} successful, {failed_inserts} failed")
 
@@ -1694,26 +2121,162 @@ def fetch_system_temperature_data():
         traceback.print_exc()
         return
 
+@shared_task
+def poll_critical_systems():
+    """
+    Re-poll only the systems whose last reading was at or above
+    CRITICAL_TEMP_THRESHOLD, every CRITICAL_CHECK_INTERVAL seconds.
+    Due systems are read from the CRITICAL_POLL_KEY sorted set, so a tick
+    costs one ZRANGEBYSCORE when nothing is hot, regardless of fleet size.
+    """
+    r = get_redis_lock_client()
+    due = r.zrangebyscore(CRITICAL_POLL_KEY, 0, time.time())
+    if not due:
+        return "no_due_systems"
+
+    lock_key = "celery:lock:poll_critical_systems"
+    lock_token = acquire_task_lock(r, lock_key, CRITICAL_CHECK_INTERVAL * 4)
+    if not lock_token:
+        print("⏭️  SKIPPING critical poll: already running")
+        return "skipped_locked"
+
+    try:
+        print(f"🔥 Critical poll: {len(due)} system(s) due: {due}")
+        bmc_credentials = parse_bmc_credentials(due)
+
+        # Systems that lost their credentials or were deleted stop being tracked
+        gone = [name for name in due if name not in bmc_credentials]
+        if gone:
+            r.zrem(CRITICAL_POLL_KEY, *gone)
+            r.hdel(CRITICAL_POLL_FAILURES_KEY, *gone)
+
+        created_time = datetime.now()
+        system_temperature_list = []
+        poll_results = []
+        failed = []
+
+        # Critical systems are re-read concurrently, like the full sweep
+        due_credentials = list(bmc_credentials.items())
+        fetched = EXECUTOR.map(lambda item: fetch_gpu_temperatures_for_system(*item), due_credentials)
+
+        for (system_name, credentials), gpu_temperatures in zip(due_credentials, fetched):
+            if gpu_temperatures is None:
+                logger.warning("✗ %s: critical re-poll failed", system_name)
+                failed.append(system_name)
+                continue
+
+            record_gpu_temperature_metrics(system_name, gpu_temperatures)
+            is_critical, max_temp, _ = is_critical_temperature(gpu_temperatures)
+            poll_results.append((system_name, is_critical))
+            logger.debug("%s %s: max %s°C", '🔥' if is_critical else '✅', system_name, max_temp)
+
+            system_temperature_list.append(
+                {
+                    "system": system_name,
+                    "bmc_ip": credentials["bmc_ip"],
+                    "gpu_temperatures": gpu_temperatures,
+                    "symbol": "°C",
+                    "created": created_time,
+                    "updated": created_time,
+                }
+            )
+
+        # Failed systems stay on the fast schedule until they run out of retries
+        next_due = time.time() + CRITICAL_CHECK_INTERVAL
+        retry = record_critical_poll_failures(failed, r)
+        if retry:
+            r.zadd(CRITICAL_POLL_KEY, {name: next_due for name in retry})
+        update_critical_poll_schedule(poll_results, r)
+
+        if system_temperature_list and SystemTemperature is not None:
+            try:
+                SystemTemperature().create_many(system_temperature_list)
+            except Exception as e:
+                print(f"Failed to insert {len(system_temperature_list)} critical records: {e}")
+
+        return f"success_{len(system_temperature_list)}_readings"
+
+    finally:
+        release_task_lock(r, lock_key, lock_token)
+
+
+def _ipmi_lan_args(bmc_ip: str, username: str, password: str):
+    return ["-I", "lan", "-U", username, "-P", password, "-H", bmc_ip]
+
+
+def _ipmi_sdr_cache_file(bmc_ip: str):
+    return os.path.join(IPMI_SDR_CACHE_DIR, f"sdr_{bmc_ip}.cache")
+
+
+def _ipmi_sdr_cache_path(bmc_ip: str):
+    """
+    Return bmc_ip's SDR cache file if one younger than IPMI_SDR_CACHE_MAX_AGE
+    exists, else None. Reading the SDR repository is the slow part of
+    `ipmitool sdr`; with `-S <cache>` only the sensor readings are fetched.
+    Caches are written by refresh_ipmi_sdr_caches, never on the fan poll path.
+    """
+    cache_path = _ipmi_sdr_cache_file(bmc_ip)
+    try:
+        if time.time() - os.path.getmtime(cache_path) < IPMI_SDR_CACHE_MAX_AGE:
+            return cache_path
+    except OSError:
+        pass
+    return None
+
+
+def dump_ipmi_sdr_cache(bmc_ip: str, username: str, password: str):
+    """
+    Dump bmc_ip's SDR repository to its cache file unless a fresh one exists.
+    Returns True when a usable cache is in place afterwards.
+    """
+    if _ipmi_sdr_cache_path(bmc_ip):
+        return True
+
+    # Dump to a per-process temp file and rename so concurrent workers never
+    # read a half-written cache
+    cache_path = _ipmi_sdr_cache_file(bmc_ip)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        result = subprocess.run(
+            ["ipmitool", *_ipmi_lan_args(bmc_ip, username, password), "sdr", "dump", tmp_path],
+            capture_output=True,
+            text=True,
+            timeout=IPMI_SDR_DUMP_TIMEOUT
+        )
+        if result.returncode != 0:
+            logger.warning("ipmitool sdr dump failed for %s: %s", bmc_ip, result.stderr)
+            return False
+        os.replace(tmp_path, cache_path)
+        logger.debug("Dumped SDR cache for %s to %s", bmc_ip, cache_path)
+        return True
+    except (subprocess.TimeoutExpired, OSError) as e:
+        logger.warning("Could not dump SDR cache for %s: %s", bmc_ip, e)
+        return False
+    finally:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
 def fetch_fan_speed_via_ipmi(bmc_ip: str, username: str, password: str):
     """
-    Fetch fan speed data using ipmitool sdr command.
+    Fetch fan speed data using ipmitool sdr command, reading the sensor
+    definitions from a local SDR cache when one is available. Costs at most
+    one 30s ipmitool run per call, cache or not.
     Returns a list of dictionaries with fan name and RPM speed.
     Example: [{"fan": "Fan_SYS1_1", "rpm": 9600}, {"fan": "Fan_SYS1_2", "rpm": 9400}]
     """
     try:
-        import subprocess
-        
+        cache_path = _ipmi_sdr_cache_path(bmc_ip)
+
         # Build ipmitool command
-        cmd = [
-            "ipmitool",
-            "-I", "lan",
-            "-U", username,
-            "-P", password,
-            "-H", bmc_ip,
-            "sdr"
-        ]
+        cmd = ["ipmitool", *_ipmi_lan_args(bmc_ip, username, password)]
+        if cache_path:
+            cmd += ["-S", cache_path]
+        cmd.append("sdr")
         
-        print(f"Running ipmitool command for BMC: {bmc_ip}")
+        logger.debug("Running ipmitool command for BMC: %s", bmc_ip)
         
         # Execute command with timeout
         result = subprocess.run(
@@ -1723,54 +2286,45 @@ def fetch_fan_speed_via_ipmi(bmc_ip: str, username: str, password: str):
             timeout=30
         )
         
+        if result.returncode != 0 and cache_path:
+            # A stale or corrupt cache (e.g. after a BMC firmware update) makes
+            # ipmitool fail; drop it so the next poll does a full read and the
+            # next refresh re-dumps
+            logger.warning("ipmitool with SDR cache failed for %s, discarding cache: %s", bmc_ip, result.stderr)
+            try:
+                os.unlink(cache_path)
+            except OSError:
+                pass
+            return None
+
         if result.returncode != 0:
-            print(f"ipmitool command failed for {bmc_ip}: {result.stderr}")
+            logger.warning("ipmitool command failed for %s: %s", bmc_ip, result.stderr)
             return None
         
         raw_output = result.stdout
-        print(f"ipmitool output length: {len(raw_output)} characters")
+        logger.debug("ipmitool output length: %s characters", len(raw_output))
         
         # Parse output for fan metrics
         fan_data = []
-        for line in raw_output.split('\n'):
-            # Look for lines containing "RPM"
-            if 'RPM' in line:
-                try:
-                    # Example line: "Fan_SYS1_1       | 9600 RPM          | ok"
-                    parts = [p.strip() for p in line.split('|')]
-                    if len(parts) >= 2:
-                        fan_name = parts[0].strip()
-                        # Remove "RPM" suffix from fan name if present
-                        if fan_name.endswith(' RPM'):
-                            fan_name = fan_name[:-4].strip()
-                        
-                        rpm_str = parts[1].strip()
-                        
-                        # Extract numeric RPM value
-                        rpm_match = rpm_str.split()[0]  # Get first token (the number)
-                        rpm_value = int(rpm_match)
-                        
-                        fan_data.append({
-                            "fan": fan_name,
-                            "rpm": rpm_value
-                        })
-                        print(f"Parsed: {fan_name} = {rpm_value} RPM")
-                        
-                except (ValueError, IndexError) as e:
-                    print(f"Failed to parse fan line: {line}, error: {e}")
-                    continue
-        
-        print(f"Successfully parsed {len(fan_data)} fan metrics from {bmc_ip}")
+        for match in IPMI_FAN_RPM_RE.finditer(raw_output):
+            fan_name, rpm_value = match.group(1), int(match.group(2))
+            fan_data.append({
+                "fan": fan_name,
+                "rpm": rpm_value
+            })
+            logger.debug("Parsed: %s = %s RPM", fan_name, rpm_value)
+        
+        logger.debug("Successfully parsed %s fan metrics from %s", len(fan_data), bmc_ip)
         return fan_data if fan_data else None
         
     except subprocess.TimeoutExpired:
-        print(f"ipmitool command timed out for {bmc_ip}")
+        logger.warning("ipmitool command timed out for %s", bmc_ip)
         return None
     except FileNotFoundError:
-        print("ipmitool command not found. Please install ipmitool package.")
+        logger.error("ipmitool command not found. Please install ipmitool package.")
         return None
     except Exception as e:
-        print(f"Error fetching fan speed for {bmc_ip}: {e}")
+        logger.warning("Error fetching fan speed for %s: %s", bmc_ip, e)
         return None
 
 def process_systems_batch_parallel(systems_dict, batch_name="", max_workers=10):
@@ -1789,10 +2343,10 @@ def process_systems_batch_parallel(systems_dict, batch_name="", max_workers=10):
     from concurrent.futures import ThreadPoolExecutor, as_completed
     
     if not systems_dict:
-        print(f"[{batch_name}] No systems to process (empty batch)")
+        logger.debug("[%s] No systems to process (empty batch)", batch_name)
         return None  # Distinguish from "0 fans found"
     
-    print(f"[{batch_name}] Processing {len(systems_dict)} systems with {max_workers} parallel workers...")
+    logger.debug("[%s] Processing %s systems with %s parallel workers...", batch_name, len(systems_dict), max_workers)
     
     total_fans_recorded = 0
     successful_systems = 0
@@ -1828,26 +2382,26 @@ def process_systems_batch_parallel(systems_dict, batch_name="", max_workers=10):
                                 ).set(fan_data["rpm"])
                                 metrics_recorded += 1
                             except Exception as e:
-                                print(f"[{batch_name}] [METRICS] Failed to record fan metric for {system_name}/{fan_data['fan']}: {e}")
+                                logger.warning("[%s] [METRICS] Failed to record fan metric for %s/%s: %s", batch_name, system_name, fan_data['fan'], e)
                         
                         total_fans_recorded += metrics_recorded
                         successful_systems += 1
-                        print(f"[{batch_name}] ✓ {system_name}: Recorded {metrics_recorded} fan metrics")
+                        logger.debug("[%s] ✓ %s: Recorded %s fan metrics", batch_name, system_name, metrics_recorded)
                     else:
-                        print(f"[{batch_name}] SYSTEM_FAN_SPEED gauge not available")
+                        logger.debug("[%s] SYSTEM_FAN_SPEED gauge not available", batch_name)
                 else:
                     # System responded but no fans found (could be normal or error)
                     successful_systems += 1  # Mark as successful (BMC responded)
-                    print(f"[{batch_name}] ⚠ {system_name} (BMC: {bmc_ip}): No fan data in response (0 RPM or no fans detected)")
+                    logger.debug("[%s] ⚠ %s (BMC: %s): No fan data in response (0 RPM or no fans detected)", batch_name, system_name, bmc_ip)
                         
             except TimeoutError:
                 failed_systems += 1
-                print(f"[{batch_name}] ✗ {system_name} (BMC: {bmc_ip}): Timeout after 35 seconds")
+                logger.warning("[%s] ✗ %s (BMC: %s): Timeout after 35 seconds", batch_name, system_name, bmc_ip)
             except Exception as e:
                 failed_systems += 1
-                print(f"[{batch_name}] ✗ {system_name} (BMC: {bmc_ip}): Error - {e}")
+                logger.warning("[%s] ✗ %s (BMC: %s): Error - %s", batch_name, system_name, bmc_ip, e)
     
-    print(f"[{batch_name}] Batch complete: {successful_systems} succeeded, {failed_systems} failed, {total_fans_recorded} total fans")
+    logger.info("[%s] Batch complete: %s succeeded, %s failed, %s total fans", batch_name, successful_systems, failed_systems, total_fans_recorded)
     return total_fans_recorded, successful_systems, failed_systems
 
 @shared_task
@@ -1869,9 +2423,9 @@ def fetch_system_fan_speed_data(batch_start=None, batch_end=None):
     # Acquire Redis lock to prevent duplicate execution
     r = get_redis_lock_client()
     lock_key = "celery:lock:fetch_system_fan_speed_data"
-    lock_acquired = r.set(lock_key, "locked", nx=True, ex=900)  # 15 min TTL
+    lock_token = acquire_task_lock(r, lock_key, 900)  # 15 min TTL
     
-    if not lock_acquired:
+    if not lock_token:
         print("⏭️  SKIPPING fan speed fetch: already running")
         return "skipped_locked"
     
@@ -1880,9 +2434,8 @@ def fetch_system_fan_speed_data(batch_start=None, batch_end=None):
     try:
         start_time = time.time()
         
-        # Read configuration from environment
-        max_workers = int(os.environ.get("FAN_SPEED_MAX_WORKERS", "10"))
-        batch_size = int(os.environ.get("FAN_SPEED_BATCH_SIZE", "33"))
+        max_workers = FAN_SPEED_MAX_WORKERS
+        batch_size = FAN_SPEED_BATCH_SIZE
         
         print(f"Configuration: max_workers={max_workers}, batch_size={batch_size}")
         
@@ -1964,6 +2517,40 @@ def fetch_system_fan_speed_data(batch_start=None, batch_end=None):
         traceback.print_exc()
         return
     finally:
-        # Always release the lock
-        r.delete(lock_key)
+        # Always release the lock (only if this run still owns it)
+        release_task_lock(r, lock_key, lock_token)
         print("🔓 Fan speed fetch: Lock released")
+
+
+@shared_task
+def refresh_ipmi_sdr_caches():
+    """
+    Dump SDR caches for BMCs that have none or whose cache is older than
+    IPMI_SDR_CACHE_MAX_AGE. Runs on its own schedule so the slow dumps never
+    count against fetch_system_fan_speed_data's lock TTL.
+    """
+    r = get_redis_lock_client()
+    lock_key = "celery:lock:refresh_ipmi_sdr_caches"
+    lock_token = acquire_task_lock(r, lock_key, 3600)
+    if not lock_token:
+        print("⏭️  SKIPPING SDR cache refresh: already running")
+        return "skipped_locked"
+
+    try:
+        bmc_credentials = parse_bmc_credentials()
+        stale = [
+            (credentials["bmc_ip"], credentials["username"], credentials["password"])
+            for credentials in bmc_credentials.values()
+            if not _ipmi_sdr_cache_path(credentials["bmc_ip"])
+        ]
+        if not stale:
+            return "no_stale_caches"
+
+        print(f"Dumping SDR caches for {len(stale)} BMC(s)...")
+        with ThreadPoolExecutor(max_workers=FAN_SPEED_MAX_WORKERS) as executor:
+            dumped = sum(executor.map(lambda item: dump_ipmi_sdr_cache(*item), stale))
+        print(f"SDR caches dumped: {dumped}/{len(stale)}")
+        return f"success_{dumped}_dumped"
+
+    finally:
+        release_task_lock(r, lock_key, lock_token)
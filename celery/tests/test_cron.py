@@ -0,0 +1,43 @@
+"""
+Tests for tasks.cron. Run from the celery directory:
+    python -m unittest discover -s tests -t .
+"""
+import unittest
+from unittest import mock
+
+from tasks import cron
+
+
+class FetchSystemTemperatureDataAsyncTest(unittest.IsolatedAsyncioTestCase):
+    async def test_readings_are_saved(self):
+        gpu_temperatures = [40.0] * 8
+        credentials = {
+            name: {"bmc_ip": bmc_ip, "username": "user", "password": "pass", "system_type": "smci"}
+            for name, bmc_ip in (("smci-a1", "10.0.0.1"), ("smci-a2", "10.0.0.2"))
+        }
+        systems = mock.Mock()
+        systems.find.return_value = [{"system": name} for name in credentials]
+        system_temp = mock.Mock()
+        system_temp.create_many.return_value = len(credentials)
+
+        with mock.patch.multiple(
+            cron,
+            get_async_redis_client=mock.Mock(return_value=mock.AsyncMock()),
+            get_critical_systems=mock.AsyncMock(return_value={}),
+            parse_bmc_credentials=mock.Mock(return_value=credentials),
+            Systems=mock.Mock(return_value=systems),
+            SystemTemperature=mock.Mock(return_value=system_temp),
+            load_last_check_times=mock.AsyncMock(return_value={}),
+            flush_system_check_updates=mock.AsyncMock(),
+            fetch_gpu_temperatures_with_retry_async=mock.AsyncMock(return_value=(gpu_temperatures, 1, [])),
+        ):
+            await cron.fetch_system_temperature_data_async()
+
+        system_temp.create_many.assert_called_once()
+        saved = system_temp.create_many.call_args.args[0]
+        self.assertEqual(sorted(record["system"] for record in saved), sorted(credentials))
+        self.assertTrue(all(record["gpu_temperatures"] == gpu_temperatures for record in saved))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 import os
 from datetime import datetime
 from pymongo import MongoClient
+from pymongo.errors import BulkWriteError
 from bson import ObjectId
 from dotenv import load_dotenv
 
@@ -24,6 +25,22 @@ class Database(object):
         inserted = self.db[collection_name].insert_one(element)  # insert data to db
         return str(inserted.inserted_id)
 
+    def insert_many(self, elements, collection_name):
+        # one round trip for a whole polling cycle instead of one per reading
+        if not elements:
+            return 0
+        # keep timestamps the caller already set (e.g. one per polling cycle)
+        now = datetime.now()
+        for element in elements:
+            element.setdefault("created", now)
+            element.setdefault("updated", now)
+        try:
+            inserted = self.db[collection_name].insert_many(elements, ordered=False)
+        except BulkWriteError as e:
+            # unordered: the good documents are already written, report them
+            return e.details.get("nInserted", 0)
+        return len(inserted.inserted_ids)
+
     def find(
         self,
         criteria,
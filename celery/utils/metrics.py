@@ -1,40 +1,154 @@
+import os
+import json
+import threading
+
+import redis
+
 try:
-    from prometheus_client import Gauge, Counter, Histogram
+    from prometheus_client import Counter, Histogram
+    from prometheus_client.core import GaugeMetricFamily
 except Exception:
     # prometheus_client may not be available in all environments
-    Gauge = Counter = Histogram = None
-
-# Power and temperature gauges
-if Gauge:
-    POWER_GAUGE = Gauge(
-        "lab_power_watts",
-        "Power reading in watts",
-        ["site", "rack", "sensor"],
-        multiprocess_mode='mostrecent'
-    )
+    Counter = Histogram = GaugeMetricFamily = None
 
-    TEMP_GAUGE = Gauge(
-        "lab_temperature_celsius",
-        "Lab temperature reading in celsius",
-        ["site", "sensor"],
-        multiprocess_mode='mostrecent'
-    )
+# Power and temperature gauges.
+# Every label value must come from inventory (site, PDU/system hostname,
+# rack location, GPU index, fan name), never from a reading or timestamp:
+# each label combination stays in its Redis hash until the key expires.
+#
+# Readings are published to Redis rather than prometheus_client's
+# multiprocess db files: the exporter then reads one hash per metric on a
+# scrape instead of merging a file per (recycled) worker process.
+METRICS_KEY_PREFIX = "metrics:gauge:"
+METRICS_KEY_TTL = 7 * 24 * 3600  # drop a metric whose task stopped running
 
-    SYSTEM_GPU_TEMP_GAUGE = Gauge(
-        "system_gpu_temperature_celsius",
-        "GPU temperature per system",
-        ["system", "gpu"],
-        multiprocess_mode='mostrecent'
-    )
+_redis_client = None
+
+
+def _get_redis():
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.Redis(
+            host=str(os.environ.get("REDIS_HOST") or "localhost"),
+            port=int(os.environ.get("REDIS_PORT") or 6379),
+            password=os.environ.get("REDIS_PASSWORD") or None,
+            db=0,
+            decode_responses=True,
+        )
+    return _redis_client
+
+
+class _RedisGaugeChild(object):
+    def __init__(self, gauge, field):
+        self._gauge = gauge
+        self._field = field
+
+    def set(self, value):
+        self._gauge._set(self._field, value)
+
+
+class RedisGauge(object):
+    """
+    Gauge with the prometheus_client labels(...).set(...) interface whose
+    values are buffered in the process and written to a Redis hash by
+    flush_gauges(); the hash field is the JSON list of label values.
+    """
+
+    def __init__(self, name, documentation, labelnames):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.key = METRICS_KEY_PREFIX + name
+        self._pending = {}
+        self._lock = threading.Lock()
+        # Label values come from inventory, so the set of children is bounded;
+        # each one keeps its encoded hash field for the life of the process
+        self._children = {}
+
+    def labels(self, **labelvalues):
+        values = tuple(str(labelvalues[label]) for label in self.labelnames)
+        child = self._children.get(values)
+        if child is None:
+            child = _RedisGaugeChild(self, json.dumps(list(values)))
+            self._children[values] = child
+        return child
+
+    def _set(self, field, value):
+        with self._lock:
+            self._pending[field] = float(value)
+
+    def _take_pending(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        return pending
+
+
+POWER_GAUGE = RedisGauge(
+    "lab_power_watts",
+    "Power reading in watts",
+    ["site", "rack", "sensor"],
+)
+
+TEMP_GAUGE = RedisGauge(
+    "lab_temperature_celsius",
+    "Lab temperature reading in celsius",
+    ["site", "sensor"],
+)
+
+SYSTEM_GPU_TEMP_GAUGE = RedisGauge(
+    "system_gpu_temperature_celsius",
+    "GPU temperature per system",
+    ["system", "gpu"],
+)
+
+SYSTEM_FAN_SPEED = RedisGauge(
+    "system_fan_speed_rpm",
+    "Fan speed in RPM per system",
+    ["system", "fan"],
+)
+
+GAUGES = (POWER_GAUGE, TEMP_GAUGE, SYSTEM_GPU_TEMP_GAUGE, SYSTEM_FAN_SPEED)
+
+
+def flush_gauges(redis_client=None):
+    """Write every buffered gauge value to Redis in one pipeline."""
+    updates = [(gauge, gauge._take_pending()) for gauge in GAUGES]
+    updates = [(gauge, pending) for gauge, pending in updates if pending]
+    if not updates:
+        return 0
+
+    try:
+        with (redis_client or _get_redis()).pipeline(transaction=False) as pipe:
+            for gauge, pending in updates:
+                pipe.hset(gauge.key, mapping=pending)
+                pipe.expire(gauge.key, METRICS_KEY_TTL)
+            pipe.execute()
+    except Exception as e:
+        print(f"[METRICS] Failed to publish gauges to Redis: {e}")
+        return 0
+
+    return sum(len(pending) for _, pending in updates)
+
+
+class RedisGaugeCollector(object):
+    """prometheus_client collector that serves the gauges published to Redis."""
+
+    def __init__(self, redis_client=None):
+        self._redis = redis_client
+
+    def collect(self):
+        client = self._redis or _get_redis()
+        with client.pipeline(transaction=False) as pipe:
+            for gauge in GAUGES:
+                pipe.hgetall(gauge.key)
+            snapshots = pipe.execute()
+
+        for gauge, snapshot in zip(GAUGES, snapshots):
+            family = GaugeMetricFamily(gauge.name, gauge.documentation, labels=gauge.labelnames)
+            for field, value in snapshot.items():
+                family.add_metric(json.loads(field), float(value))
+            yield family
 
-    SYSTEM_FAN_SPEED = Gauge(
-        "system_fan_speed_rpm",
-        "Fan speed in RPM per system",
-        ["system", "fan"],
-        multiprocess_mode='mostrecent'
-    )
-else:
-    POWER_GAUGE = TEMP_GAUGE = SYSTEM_GPU_TEMP_GAUGE = SYSTEM_FAN_SPEED = None
 
 # HTTP metrics
 if Counter:
@@ -51,6 +165,9 @@ if Histogram:
         "http_request_duration_seconds",
         "HTTP request latency in seconds",
         ["endpoint"],
+        # A handful of cutoffs instead of the 15 defaults: fewer bucket
+        # updates per observe() and a smaller scrape
+        buckets=(0.01, 0.05, 0.2, 1.0, 5.0),
     )
 else:
     HTTP_REQ_LATENCY = None
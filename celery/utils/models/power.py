@@ -50,6 +50,17 @@ class Power(object):
         res = self.db.insert(power_data, self.collection_name)
         return "Inserted Id " + res
 
+    def create_many(self, power_list):
+        # Validator will throw error if any element is invalid
+        for power_data in power_list:
+            self.validator.validate(
+                power_data,
+                self.fields,
+                self.create_required_fields,
+                self.create_optional_fields,
+            )
+        return self.db.insert_many(power_list, self.collection_name)
+
     def find(self, power_data):  # find all
         return self.db.find(power_data, self.collection_name)
 
@@ -48,6 +48,17 @@ class SystemTemperature(object):
         res = self.db.insert(system_temperature_data, self.collection_name)
         return "Inserted Id " + res
 
+    def create_many(self, system_temperature_list):
+        # Validator will throw error if any element is invalid
+        for system_temperature_data in system_temperature_list:
+            self.validator.validate(
+                system_temperature_data,
+                self.fields,
+                self.create_required_fields,
+                self.create_optional_fields,
+            )
+        return self.db.insert_many(system_temperature_list, self.collection_name)
+
     def find(self, system_temperature_data, sort=None, limit=0):  # find all
         return self.db.find(system_temperature_data, self.collection_name, sort=sort, limit=limit)
 
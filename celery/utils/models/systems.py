@@ -46,8 +46,8 @@ class Systems(object):
         res = self.db.insert(system_data, self.collection_name)
         return "Inserted Id " + res
 
-    def find(self, system_data):  # find all
-        return self.db.find(system_data, self.collection_name)
+    def find(self, system_data, projection=None):  # find all
+        return self.db.find(system_data, self.collection_name, projection=projection)
 
     def find_by_id(self, id):
         return self.db.find_by_id(id, self.collection_name)
@@ -49,6 +49,17 @@ class Temperature(object):
         res = self.db.insert(temperature_data, self.collection_name)
         return "Inserted Id " + res
 
+    def create_many(self, temperature_list):
+        # Validator will throw error if any element is invalid
+        for temperature_data in temperature_list:
+            self.validator.validate(
+                temperature_data,
+                self.fields,
+                self.create_required_fields,
+                self.create_optional_fields,
+            )
+        return self.db.insert_many(temperature_list, self.collection_name)
+
     def find(self, temperature_data):  # find all
         return self.db.find(temperature_data, self.collection_name)
 
@@ -34,6 +34,11 @@ import {
   RotateCcw,
 } from "lucide-react";
 
+// Scan results are polled until the job finishes, giving up just past the
+// backend's 310s scanner timeout in case the job was lost with its worker
+const SCAN_POLL_INTERVAL_MS = 2000;
+const SCAN_POLL_DEADLINE_MS = 330_000;
+
 // ── Plain Modal ───────────────────────────────────────────────────────────────
 function Modal({
   open,
@@ -180,11 +185,18 @@ export default function NmapScanPage() {
   const [ignoredDevices, setIgnoredDevices] = useState<any[]>([]);
   const [disabledDevices, setDisabledDevices] = useState<any[]>([]);
 
+  // Lets an in-flight scan poll stop when the page is left
+  const isMounted = React.useRef(true);
+
   React.useEffect(() => {
+    isMounted.current = true;
     checkScannerStatus();
     fetchChangeLogs();
     fetchIgnoredDevices();
     fetchDisabledDevices();
+    return () => {
+      isMounted.current = false;
+    };
   }, []);
 
   // ── Lock / Unlock ───────────────────────────────────────────────────────────
@@ -231,15 +243,32 @@ export default function NmapScanPage() {
       const response = await axios.post(
         `${process.env.NEXT_PUBLIC_BACKEND_URL}/api/nmap-scan/scan`
       );
-      if (response.data.status === "success") {
-        setScanData(response.data);
+      // Scan runs in the background; poll until the task finishes
+      const taskId = response.data.task_id;
+      const deadline = Date.now() + SCAN_POLL_DEADLINE_MS;
+      let result = response.data;
+      while (result.status === "pending" || result.status === "running") {
+        if (Date.now() > deadline) {
+          setError("Scan did not finish in time");
+          return;
+        }
+        await new Promise((resolve) => setTimeout(resolve, SCAN_POLL_INTERVAL_MS));
+        if (!isMounted.current) return;
+        const poll = await axios.get(
+          `${process.env.NEXT_PUBLIC_BACKEND_URL}/api/nmap-scan/scan/result/${taskId}`
+        );
+        result = poll.data;
+      }
+      if (!isMounted.current) return;
+      if (result.status === "success") {
+        setScanData(result);
       } else {
-        setError(response.data.message || "Scan failed");
+        setError(result.message || "Scan failed");
       }
     } catch (e: any) {
-      setError(e.response?.data?.message || "Failed to run scan");
+      if (isMounted.current) setError(e.response?.data?.message || "Failed to run scan");
     } finally {
-      setScanning(false);
+      if (isMounted.current) setScanning(false);
     }
   };
 